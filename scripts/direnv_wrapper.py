@@ -1,8 +1,66 @@
+import shlex
 import subprocess
+import tempfile
 
 
-def run_command(command, cwd=None, env=None):
-    """Run a shell command and return (stdout, stderr, returncode)."""
+def run_command(argv, cwd=None, env=None, expect_large=False):
+    """Run a command and return (stdout, stderr, returncode).
+
+    argv is an argument list or, as before, a command string; strings are
+    split with shlex.split. The command is executed directly (no
+    intermediate /bin/sh, so use run_shell() for pipes or expansion) with
+    a generous read buffer for large outputs. Pass expect_large=True for
+    commands that emit a lot of output (e.g. ``direnv export``): output is
+    then written to temporary files instead of pipes, avoiding the
+    fill/drain cycle of the pipe buffer.
+
+    A missing or non-executable program is reported like the shell does:
+    the error message as stderr and returncode 127.
+    """
+    if isinstance(argv, str):
+        argv = shlex.split(argv)
+    try:
+        if expect_large:
+            return _run_to_tempfiles(argv, cwd=cwd, env=env)
+
+        # Capture raw bytes and decode each stream once, instead of decoding
+        # chunk by chunk through a text wrapper
+        result = subprocess.run(
+            argv,
+            shell=False,
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            bufsize=65536,
+        )
+    except (FileNotFoundError, PermissionError) as e:
+        return "", str(e), 127
+    return _decode(result.stdout), _decode(result.stderr), result.returncode
+
+
+def _run_to_tempfiles(argv, cwd=None, env=None):
+    """Run argv with stdout/stderr redirected to temporary files."""
+    with tempfile.TemporaryFile(mode="w+b") as out, tempfile.TemporaryFile(
+        mode="w+b"
+    ) as err:
+        result = subprocess.run(
+            argv, shell=False, cwd=cwd, env=env, stdout=out, stderr=err
+        )
+        out.seek(0)
+        err.seek(0)
+        return _decode(out.read()), _decode(err.read()), result.returncode
+
+
+def _decode(data):
+    """Decode captured output in a single pass."""
+    return data.decode("utf-8", errors="replace")
+
+
+def run_shell(command, cwd=None, env=None):
+    """Run a shell command string and return (stdout, stderr, returncode).
+
+    Only use this when shell features (pipes, expansion) are required.
+    """
     result = subprocess.run(
         command, shell=True, cwd=cwd, env=env, capture_output=True, text=True
     )
@@ -11,5 +69,5 @@ def run_command(command, cwd=None, env=None):
 
 def direnv(command="status", cwd=None):
     """Simple wrapper for direnv commands."""
-    cmd = f"direnv {command}"
-    return run_command(cmd, cwd=cwd)
+    argv = ["direnv", *shlex.split(command)]
+    return run_command(argv, cwd=cwd, expect_large=argv[1:2] == ["export"])
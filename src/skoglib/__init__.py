@@ -61,30 +61,92 @@ Configuration and Logging:
     >>> configure_logging(level="DEBUG")  # Enable detailed logging
 """
 
-from .executable import run_executable, ExecutionResult
-from .exceptions import (
-    SkogAIError,
-    ExecutableNotFoundError,
-    ExecutionError,
-    TimeoutError,
-    PermissionError,
-    ConfigurationError,
-)
-from .logging_config import (
-    configure_logging,
-    configure_from_env,
-    get_logger,
-    get_performance_logger,
-)
-from .config import (
-    SkogAIConfig,
-    get_config,
-    reset_config,
-    find_executable,
-    validate_executable,
-    resolve_path,
-    merge_configs,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .executable import (
+        run_executable,
+        run_executable_async,
+        run_many,
+        ExecutionResult,
+        ExecutablePool,
+    )
+    from .exceptions import (
+        SkogAIError,
+        ExecutableNotFoundError,
+        ExecutionError,
+        TimeoutError,
+        PermissionError,
+        ConfigurationError,
+        batched_errors,
+    )
+    from .logging_config import (
+        configure_logging,
+        configure_from_env,
+        get_logger,
+        get_performance_logger,
+    )
+    from .config import (
+        SkogAIConfig,
+        get_config,
+        reset_config,
+        find_executable,
+        find_executables,
+        validate_executable,
+        resolve_path,
+        merge_configs,
+    )
+
+# Public names are loaded lazily (PEP 562) so that `import skoglib` and
+# `python -m skoglib` do not pay for submodules the caller never touches.
+_LAZY: Dict[str, str] = {
+    # Main functionality
+    "run_executable": ".executable",
+    "run_executable_async": ".executable",
+    "run_many": ".executable",
+    "ExecutionResult": ".executable",
+    "ExecutablePool": ".executable",
+    # Exception hierarchy
+    "SkogAIError": ".exceptions",
+    "ExecutableNotFoundError": ".exceptions",
+    "ExecutionError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "PermissionError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "batched_errors": ".exceptions",
+    # Logging configuration
+    "configure_logging": ".logging_config",
+    "configure_from_env": ".logging_config",
+    "get_logger": ".logging_config",
+    "get_performance_logger": ".logging_config",
+    # Configuration management
+    "SkogAIConfig": ".config",
+    "get_config": ".config",
+    "reset_config": ".config",
+    "find_executable": ".config",
+    "find_executables": ".config",
+    "validate_executable": ".config",
+    "resolve_path": ".config",
+    "merge_configs": ".config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API members from their submodule on first access."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # Package metadata
 __version__ = "0.1.0"
@@ -95,7 +157,10 @@ __email__ = "emil@skogsund.se"
 __all__ = [
     # Main functionality
     "run_executable",
+    "run_executable_async",
+    "run_many",
     "ExecutionResult",
+    "ExecutablePool",
     # Exception hierarchy
     "SkogAIError",
     "ExecutableNotFoundError",
@@ -103,6 +168,7 @@ __all__ = [
     "TimeoutError",
     "PermissionError",
     "ConfigurationError",
+    "batched_errors",
     # Logging configuration
     "configure_logging",
     "configure_from_env",
@@ -113,6 +179,7 @@ __all__ = [
     "get_config",
     "reset_config",
     "find_executable",
+    "find_executables",
     "validate_executable",
     "resolve_path",
     "merge_configs",
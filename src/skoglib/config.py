@@ -6,27 +6,47 @@ environment variable overrides, configuration validation, executable discovery,
 and thread-safe access. Follows the "batteries included but minimal" philosophy.
 """
 
+import logging
 import os
+import shutil
+import stat
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Callable, Sequence, Tuple, Union
 
 from .exceptions import ConfigurationError
-from .logging_config import get_logger
 
 
-logger = get_logger("config")
+# Logger for config module, created on first use (see _get_logger)
+_logger: Optional[logging.Logger] = None
 
 
-@dataclass
+def _get_logger() -> logging.Logger:
+    """Return the config logger, importing logging_config on first use."""
+    global _logger
+    if _logger is None:
+        from .logging_config import get_logger
+
+        _logger = get_logger("config")
+    return _logger
+
+
+# Valid log level names, in severity order for error messages
+_VALID_LOG_LEVELS_ORDERED = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_VALID_LOG_LEVELS_ORDERED)
+
+
+@dataclass(frozen=True)
 class SkogAIConfig:
     """
     Main configuration class for SkogAI library.
 
     This dataclass provides sensible defaults while allowing customization
     through environment variables (with SKOGAI_ prefix) or direct instantiation.
-    All access is thread-safe and configuration values are validated on creation.
+    Instances are frozen and hashable, so they are safe to share between threads
+    and to use as cache keys; use dataclasses.replace() to derive a modified
+    copy. Configuration values are validated on creation.
     """
 
     # Execution settings
@@ -36,15 +56,27 @@ class SkogAIConfig:
     log_level: str = "INFO"
 
     # Path configuration
-    executable_search_paths: List[str] = field(default_factory=list)
+    executable_search_paths: Tuple[str, ...] = field(default_factory=tuple)
 
     # Environment variable prefix
     env_prefix: str = "SKOGAI"
 
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
+        """Normalize and validate configuration after initialization."""
+        # Normalize once so readers always see the canonical form.
+        # object.__setattr__ keeps this working if the dataclass is frozen.
+        if isinstance(self.log_level, str):
+            object.__setattr__(self, "log_level", self.log_level.upper())
+        object.__setattr__(
+            self,
+            "executable_search_paths",
+            tuple(
+                os.fspath(p) if isinstance(p, os.PathLike) else p
+                for p in self.executable_search_paths
+            ),
+        )
         self._validate_config()
-        logger.debug(
+        _get_logger().debug(
             "Configuration initialized with settings",
             extra={
                 "timeout": self.default_timeout,
@@ -64,13 +96,12 @@ class SkogAIConfig:
             )
 
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ConfigurationError(
-                f"log_level must be one of: {', '.join(valid_log_levels)}",
+                f"log_level must be one of: {', '.join(_VALID_LOG_LEVELS_ORDERED)}",
                 config_key="log_level",
                 config_value=self.log_level,
-                valid_values=valid_log_levels,
+                valid_values=list(_VALID_LOG_LEVELS_ORDERED),
             )
 
         # Validate executable search paths
@@ -82,10 +113,20 @@ class SkogAIConfig:
                     config_value=path,
                 )
 
-            path_obj = Path(path)
-            if not path_obj.exists():
-                logger.warning(f"Search path does not exist: {path}")
-            elif not path_obj.is_dir():
+            # A single stat() answers both "exists" and "is a directory"
+            try:
+                st = os.stat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                _get_logger().warning(f"Search path does not exist: {path}")
+                continue
+            except OSError as e:
+                raise ConfigurationError(
+                    f"Search path is not accessible: {path}",
+                    config_key="executable_search_paths",
+                    config_value=path,
+                ) from e
+
+            if not stat.S_ISDIR(st.st_mode):
                 raise ConfigurationError(
                     f"Search path must be a directory: {path}",
                     config_key="executable_search_paths",
@@ -93,6 +134,44 @@ class SkogAIConfig:
                 )
 
 
+def _parse_search_paths(value: str) -> Tuple[str, ...]:
+    """Split a PATH-style string into its non-empty entries."""
+    return tuple(p for p in value.split(os.pathsep) if p.strip())
+
+
+# Parser and error-message expectation for each supported field type
+_COERCERS: Dict[Any, Tuple[Callable[[str], Any], str]] = {
+    int: (int, "must be an integer"),
+    str: (str, "must be a string"),
+    Tuple[str, ...]: (_parse_search_paths, "must be a path list"),
+}
+
+# Fields whose environment variable name differs from the upper-cased field
+_ENV_NAME_OVERRIDES = {"executable_search_paths": "SEARCH_PATHS"}
+
+# Fields that are not loaded from the environment
+_ENV_EXCLUDED_FIELDS = frozenset({"env_prefix"})
+
+
+def _build_env_fields() -> Tuple[Tuple[str, str, Callable[[str], Any], str], ...]:
+    """Derive the SKOGAI_* variable table from the SkogAIConfig field types."""
+    env_fields = []
+    for config_field in fields(SkogAIConfig):
+        if config_field.name in _ENV_EXCLUDED_FIELDS:
+            continue
+        parser, expected = _COERCERS[config_field.type]
+        env_suffix = _ENV_NAME_OVERRIDES.get(
+            config_field.name, config_field.name.upper()
+        )
+        env_fields.append((env_suffix, config_field.name, parser, expected))
+    return tuple(env_fields)
+
+
+# (env suffix, config field, parser, expectation) for SKOGAI_* variables,
+# computed once at import time from the dataclass definition
+_ENV_FIELDS = _build_env_fields()
+
+
 # Thread-safe configuration singleton
 _config_lock = threading.Lock()
 _cached_config: Optional[SkogAIConfig] = None
@@ -121,14 +200,16 @@ def reset_config() -> None:
     """
     Reset the cached configuration instance.
 
-    This forces the next call to get_config() to reload from environment.
-    Mainly used for testing purposes.
+    This forces the next call to get_config() to reload from environment
+    and clears memoized find_executable() lookups. Mainly used for testing
+    purposes.
     """
     global _cached_config
 
     with _config_lock:
         _cached_config = None
-        logger.debug("Configuration cache reset")
+        _found_executables.clear()
+        _get_logger().debug("Configuration cache reset")
 
 
 def load_config_from_env() -> SkogAIConfig:
@@ -136,7 +217,9 @@ def load_config_from_env() -> SkogAIConfig:
     Load configuration from environment variables.
 
     Environment variables should be prefixed with SKOGAI_ (configurable).
-    Type conversion is performed automatically based on the dataclass field types.
+    The supported variables and their parsers are derived once from the
+    SkogAIConfig field types (see _ENV_FIELDS); search paths use the platform
+    path separator like PATH.
 
     Returns:
         SkogAIConfig instance with values from environment or defaults.
@@ -145,42 +228,43 @@ def load_config_from_env() -> SkogAIConfig:
 
     config_values: Dict[str, Any] = {}
 
-    # Parse timeout
-    timeout_var = f"{env_prefix}_DEFAULT_TIMEOUT"
-    if timeout_var in os.environ:
+    for env_suffix, field_name, parser, expected in _ENV_FIELDS:
+        env_var = f"{env_prefix}_{env_suffix}"
+        raw_value = os.environ.get(env_var)
+        if raw_value is None:
+            continue
+
         try:
-            config_values["default_timeout"] = int(os.environ[timeout_var])
+            config_values[field_name] = parser(raw_value)
         except ValueError as e:
             raise ConfigurationError(
-                f"Invalid value for {timeout_var}: must be an integer",
-                config_key="default_timeout",
-                config_value=os.environ[timeout_var],
+                f"Invalid value for {env_var}: {expected}",
+                config_key=field_name,
+                config_value=raw_value,
             ) from e
 
-    # Parse log level
-    log_level_var = f"{env_prefix}_LOG_LEVEL"
-    if log_level_var in os.environ:
-        config_values["log_level"] = os.environ[log_level_var].upper()
-
-    # Parse search paths (colon-separated like PATH)
-    search_paths_var = f"{env_prefix}_SEARCH_PATHS"
-    if search_paths_var in os.environ:
-        paths = os.environ[search_paths_var].split(":")
-        # Filter out empty strings
-        config_values["executable_search_paths"] = [p for p in paths if p.strip()]
-
-    logger.debug(
+    _get_logger().debug(
         f"Loaded configuration from environment variables with prefix {env_prefix}"
     )
     return SkogAIConfig(**config_values)
 
 
+# Memoized successful find_executable() lookups; misses are not stored
+_FOUND_EXECUTABLES_MAX = 1024
+_found_executables: Dict[Tuple[str, Tuple[str, ...], str], str] = {}
+
+
 def find_executable(
-    name: str, search_paths: Optional[List[str]] = None
+    name: str, search_paths: Optional[Sequence[str]] = None
 ) -> Optional[str]:
     """
     Find executable in system PATH and optional additional search paths.
 
+    Successful lookups are memoized per (name, search_paths, PATH)
+    combination and re-validated with a single stat() on reuse, so repeated
+    calls for the same tool avoid re-walking the filesystem. Misses are never
+    cached, so a tool installed later is picked up on the next call.
+
     Args:
         name: Name of the executable to find
         search_paths: Additional paths to search (optional)
@@ -188,46 +272,145 @@ def find_executable(
     Returns:
         Full path to executable if found, None otherwise
     """
-    logger.debug(f"Searching for executable: {name}")
+    _get_logger().debug(f"Searching for executable: {name}")
 
     # If name is already an absolute path, validate it
     if os.path.isabs(name):
-        if os.path.isfile(name) and os.access(name, os.X_OK):
-            logger.debug(f"Found executable at absolute path: {name}")
+        if validate_executable(name):
+            _get_logger().debug(f"Found executable at absolute path: {name}")
             return name
         else:
-            logger.debug(f"Absolute path not executable or not found: {name}")
+            _get_logger().debug(
+                f"Absolute path not executable or not found: {name}"
+            )
             return None
 
-    # Build search paths: additional paths first, then system PATH
-    all_paths = []
-    if search_paths:
-        all_paths.extend(search_paths)
+    key = (name, tuple(search_paths or ()), os.environ.get("PATH", ""))
+    cached = _found_executables.get(key)
+    if cached is not None:
+        try:
+            if _is_executable_file(cached):
+                return cached
+        except (OSError, ValueError):
+            pass
+        _found_executables.pop(key, None)
+
+    result = _search_executable(*key)
+    if result is not None:
+        if len(_found_executables) >= _FOUND_EXECUTABLES_MAX:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _found_executables.pop(next(iter(_found_executables)), None)
+        _found_executables[key] = result
+    return result
+
+
+def _search_executable(
+    name: str, search_paths: Tuple[str, ...], path_env: str
+) -> Optional[str]:
+    """Search additional paths and then PATH for an executable."""
+    # Build search paths: additional paths first, then system PATH. Blank
+    # entries are dropped so they are not treated as the current directory.
+    all_paths = list(search_paths)
+    if path_env:
+        all_paths.extend(path_env.split(os.pathsep))
+    paths = [p for p in all_paths if p.strip()]
+
+    if os.sep in name or (os.altsep and os.altsep in name):
+        # shutil.which() would resolve "bin/tool" against the current
+        # directory only; keep joining it onto every search path instead
+        result = None
+        for path in paths:
+            candidate = str(Path(path) / name)
+            try:
+                if _is_executable_file(candidate):
+                    result = candidate
+                    break
+            except (OSError, ValueError):
+                continue
+    else:
+        result = shutil.which(name, path=os.pathsep.join(paths)) if paths else None
+    if result is not None:
+        _get_logger().debug(f"Found executable: {name} -> {result}")
+        return result
+
+    _get_logger().debug(f"Executable not found: {name}")
+    return None
+
+
+def find_executables(
+    names: Sequence[str], search_paths: Optional[Sequence[str]] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Find several executables with a single pass over the search directories.
+
+    Each directory is listed once with os.scandir and only entries whose
+    name was requested are checked, so resolving a whole toolchain costs
+    one directory scan per search path instead of one probe per name and
+    path. As with find_executable, additional paths are searched before
+    PATH and the first match wins.
+
+    Args:
+        names: Names of the executables to find
+        search_paths: Additional paths to search (optional)
 
-    # Add system PATH
+    Returns:
+        Dictionary mapping each name to its full path, or None if not found
+    """
+    results: Dict[str, Optional[str]] = {}
+    pending = set()
+
+    for name in names:
+        if os.path.isabs(name) or os.sep in name:
+            results[name] = find_executable(name, search_paths)
+        else:
+            results[name] = None
+            pending.add(name)
+
+    all_paths = list(search_paths or ())
     system_path = os.environ.get("PATH", "")
     if system_path:
         all_paths.extend(system_path.split(os.pathsep))
 
-    # Search each path
+    scanned = set()
     for path in all_paths:
-        if not path.strip():
+        if not pending:
+            break
+        if not path.strip() or path in scanned:
             continue
+        scanned.add(path)
 
-        full_path = Path(path) / name
-        if full_path.is_file() and os.access(full_path, os.X_OK):
-            result = str(full_path)
-            logger.debug(f"Found executable: {name} -> {result}")
-            return result
-
-    logger.debug(f"Executable not found: {name}")
-    return None
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if (
+                        entry.name in pending
+                        and entry.is_file()
+                        and os.access(entry.path, os.X_OK)
+                    ):
+                        results[entry.name] = entry.path
+                        pending.discard(entry.name)
+        except OSError as e:
+            _get_logger().debug(f"Skipping unreadable search path {path}: {e}")
+
+    # Windows resolves names through PATHEXT, which a plain listing cannot
+    if pending and os.name == "nt":
+        for name in pending:
+            results[name] = find_executable(name, search_paths)
+
+    found = sum(1 for result in results.values() if result is not None)
+    _get_logger().debug(f"Resolved {found} of {len(results)} executables")
+    return results
 
 
 def validate_executable(path: str) -> bool:
     """
     Validate that a path points to an executable file.
 
+    Uses a single stat() call and checks the mode bits instead of combining
+    is_file() with os.access(). Note that this reports a file as executable
+    when any execute bit is set, without checking whether the current
+    effective user is the one allowed to execute it.
+
     Args:
         path: Path to validate
 
@@ -235,15 +418,23 @@ def validate_executable(path: str) -> bool:
         True if path is an executable file, False otherwise
     """
     try:
-        path_obj = Path(path)
-        is_valid = path_obj.is_file() and os.access(path_obj, os.X_OK)
-        logger.debug(f"Executable validation: {path} -> {is_valid}")
+        is_valid = _is_executable_file(path)
+        _get_logger().debug(f"Executable validation: {path} -> {is_valid}")
         return is_valid
     except (OSError, ValueError) as e:
-        logger.debug(f"Executable validation failed for {path}: {e}")
+        _get_logger().debug(f"Executable validation failed for {path}: {e}")
         return False
 
 
+def _is_executable_file(path: str) -> bool:
+    """Return True if path is a regular file with an execute bit set.
+
+    Raises OSError/ValueError from os.stat() for missing or invalid paths.
+    """
+    st = os.stat(path)
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
 def resolve_path(path: Union[str, Path], base_dir: Optional[str] = None) -> Path:
     """
     Resolve a path to an absolute Path object.
@@ -255,17 +446,14 @@ def resolve_path(path: Union[str, Path], base_dir: Optional[str] = None) -> Path
     Returns:
         Absolute Path object
     """
-    path_obj = Path(path)
+    path_str = os.fspath(path)
 
-    if path_obj.is_absolute():
-        return path_obj
+    if os.path.isabs(path_str):
+        return Path(path_str)
 
-    # Handle relative paths
-    if base_dir:
-        base_path = Path(base_dir)
-        return (base_path / path_obj).resolve()
-    else:
-        return path_obj.resolve()
+    # Handle relative paths with os.path and only build a Path at the boundary
+    base = base_dir if base_dir else os.getcwd()
+    return Path(os.path.realpath(os.path.join(base, path_str)))
 
 
 def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
@@ -278,10 +466,15 @@ def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged configuration dictionary
     """
+    # Common two-config case (defaults + overrides) in a single dict display
+    if len(configs) == 2 and configs[0] and configs[1]:
+        return {**configs[0], **configs[1]}
+
     result: Dict[str, Any] = {}
+    update = result.update
 
     for config in configs:
         if config:
-            result.update(config)
+            update(config)
 
     return result
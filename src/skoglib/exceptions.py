@@ -36,7 +36,7 @@ Usage Examples:
     ...     result = run_executable("some_command", invalid_args=True)
     ... except SkogAIError as e:
     ...     print(f"Library error: {e}")
-    ...     print(f"Context: {e.context}")
+    ...     print(f"Details: {e.details}")
 
     Execution error handling:
 
@@ -51,12 +51,104 @@ Usage Examples:
 
 import time
 import logging
-from typing import Optional, Dict, Any, List
-from .logging_config import get_logger
-
-
-# Logger for exception module
-logger = get_logger("exceptions")
+import threading
+import warnings
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple, Type, cast
+
+
+# Logger for exception module, created on first use so that importing the
+# exception classes does not initialize the logging subsystem
+_logger: Optional[logging.Logger] = None
+
+# The logger's isEnabledFor, bound once alongside it. Logger caches the
+# result per level and clears that cache whenever logging is reconfigured,
+# so the bound method stays correct without any invalidation of our own.
+_is_enabled_for: Optional[Callable[[int], bool]] = None
+
+_ERROR = logging.ERROR
+
+
+def _get_logger() -> logging.Logger:
+    """Return the exceptions logger, importing logging_config on first use."""
+    global _logger, _is_enabled_for
+    if _logger is None:
+        from .logging_config import get_logger
+
+        _logger = get_logger("exceptions")
+        _is_enabled_for = _logger.isEnabledFor
+    return _logger
+
+
+# Suggestions shared by every instance of each exception class; tuples so
+# that no caller can mutate the shared value. They are not stored in
+# details, only added when an error is serialized (see SkogAIError.suggestions)
+_EXECUTABLE_NOT_FOUND_SUGGESTIONS = (
+    "Install the tool using your package manager",
+    "Check if the executable is in your PATH variable",
+    "Use absolute path to the executable",
+    "Verify the executable name is correct",
+)
+
+_EXECUTION_SUGGESTIONS = (
+    "Check the command arguments for correctness",
+    "Verify input data and file permissions",
+    "Review stderr output for specific error details",
+    "Consult the tool's documentation for exit code meanings",
+)
+
+_PERMISSION_SUGGESTIONS = (
+    "Check if the file has execute permissions (chmod +x)",
+    "Run with appropriate privileges (sudo if needed)",
+    "Verify you own the file or have group access",
+    "Check if the file is in a restricted directory",
+)
+
+_CONFIGURATION_SUGGESTIONS = (
+    "Check configuration file syntax and values",
+    "Verify environment variables are set correctly",
+    "Review parameter combinations for conflicts",
+    "Consult documentation for valid configuration options",
+)
+
+_TIMEOUT_SUGGESTIONS = (
+    "Check for hanging processes or infinite loops",
+    "Verify input data doesn't cause processing delays",
+    "Consider breaking large tasks into smaller chunks",
+)
+
+# Per-thread collector used by batched_errors()
+_batch_state = threading.local()
+
+# Per-thread pool of released ExecutableNotFoundError instances (see
+# ExecutableNotFoundError.get) and the most each thread keeps around
+_enf_pool = threading.local()
+_ENF_POOL_SIZE = 8
+
+# Bound once so sampling the timestamp avoids the time-module attribute lookup
+_time = time.time
+
+# Maximum length of a single details value rendered by SkogAIError.__str__
+_MAX_DETAIL_LENGTH = 500
+
+# ExecutableNotFoundError / PermissionError message templates
+_ENF_MSG = "Executable '%s' not found in PATH or specified location"
+_ENF_MSG_SEARCHED = _ENF_MSG + " (searched: %s)"
+_PERMISSION_MSG = "Permission denied: Cannot execute '%s'"
+
+
+def _format_cmd(executable: str, command_args: Optional[List[str]]) -> str:
+    """Render an executable and its arguments as a single command line."""
+    if not command_args:
+        return executable
+    return executable + " " + " ".join(command_args)
+
+
+def _truncate(text: str, limit: int = _MAX_DETAIL_LENGTH) -> str:
+    """Shorten text to limit characters, marking that it was cut."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "...(truncated)"
 
 
 class SkogAIError(Exception):
@@ -73,10 +165,11 @@ class SkogAIError(Exception):
 
     Attributes:
         message: Human-readable error description
-        context: Dictionary containing debugging context and metadata
+        details: Dictionary containing debugging context and metadata
+        context: Deprecated alias of details
 
     Examples:
-        Creating a custom error with context:
+        Creating a custom error with details:
 
         >>> error = SkogAIError("Something went wrong", {
         ...     "operation": "test",
@@ -84,7 +177,7 @@ class SkogAIError(Exception):
         ... })
         >>> print(error.message)
         Something went wrong
-        >>> print(error.context["operation"])
+        >>> print(error.details["operation"])
         test
 
         Handling any skoglib error:
@@ -94,10 +187,19 @@ class SkogAIError(Exception):
         ...     pass
         ... except SkogAIError as e:
         ...     print(f"Library error: {e}")
-        ...     if e.context:
-        ...         print(f"Additional context: {e.context}")
+        ...     if e.details:
+        ...         print(f"Additional context: {e.details}")
     """
 
+    # Exceptions always carry a __dict__, so this saves no memory; the
+    # slots give these hot attributes fixed storage with faster access
+    # than a dict lookup. Subclasses declare their own __slots__ for the
+    # same reason.
+    __slots__ = ("_message", "_details", "_ts", "_str")
+
+    # Class-level suggestions, overridden by subclasses
+    _suggestions: Tuple[str, ...] = ()
+
     def __init__(
         self,
         message: str,
@@ -114,47 +216,258 @@ class SkogAIError(Exception):
             context: Additional debugging context (deprecated, use details)
             log_error: Whether to log this error when raised (default: True)
         """
-        super().__init__(message)
-        self.message = message
-
-        # Support both details and context for backward compatibility
-        if details is not None and context is not None:
+        # Support both details and context for backward compatibility.
+        # Without either, details stay None and an empty dict is only
+        # created if they are read.
+        if details is None:
+            if context is not None:
+                warnings.warn(
+                    "The 'context' argument is deprecated; use 'details'",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                details = context
+        elif context is not None:
             raise ValueError(
-                "Cannot specify both 'details' and 'context'. Use 'details' (preferred)."
+                "Cannot specify both 'details' and 'context'. "
+                "Use 'details' (preferred)."
             )
 
-        self.details = details or context or {}
-        self.context = self.details  # Maintain backward compatibility
-        self.timestamp = time.time()
+        self._fast_init(message, details, log_error)
 
-        # Log error with details for debugging
-        # Check if logger is enabled for ERROR level to avoid expensive operations
-        if log_error and logger.isEnabledFor(logging.ERROR):
-            if self.details:
+    def _fast_init(
+        self,
+        message: Optional[str],
+        details: Optional[Dict[str, Any]],
+        log_error: bool = True,
+    ) -> None:
+        """Initialize from an already resolved details dict.
+
+        Subclasses always build their own details and never pass context,
+        so they call this directly and skip the argument validation in
+        __init__. Subclasses pass message=None to have it built by
+        _format_message(), and details=None to have the details built by
+        _build_details() on first access.
+        """
+        if message is None:
+            message = self._format_message()
+        Exception.__init__(self, message)
+        self._message = message
+        self._details = details
+        self._ts: Optional[float] = None
+        self._str: Optional[str] = None
+
+        if log_error:
+            self._log()
+
+    def _log(self) -> None:
+        """Log this error at ERROR level.
+
+        Called at construction unless log_error=False. Code that creates
+        errors speculatively can pass log_error=False and call _log() only
+        on the path where the error is actually raised.
+        """
+        batch = getattr(_batch_state, "errors", None)
+        if batch is not None:
+            # Inside batched_errors(): logged as one record on exit
+            batch.append(self)
+            return
+
+        # Check if logger is enabled for ERROR level to avoid expensive operations;
+        # %-style arguments defer formatting until a handler emits the record.
+        # Fast path: the logger and its guard are bound after first use
+        if _is_enabled_for is None:
+            _get_logger()
+        if _is_enabled_for(_ERROR):  # type: ignore[misc]
+            logger = cast(logging.Logger, _logger)
+            details = self._peek_details()
+            if details:
                 # Use "Context:" for backward compatibility with existing tests
-                logger.error(f"{message} - Context: {self.details}")
+                logger.error("%s - Context: %s", self.message, details)
             else:
-                logger.error(message)
+                logger.error("%s", self.message)
+
+    def _format_message(self) -> str:
+        """Build the message for subclasses that pass message=None."""
+        return ""
+
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details for subclasses that pass details=None."""
+        return {}
+
+    def _peek_details(self) -> Optional[Dict[str, Any]]:
+        """Return the details, or None where they would be a new empty dict.
+
+        Used by _log() and __str__(), which only need to know whether
+        there are any details, so that errors without details never
+        allocate a dict for them.
+        """
+        details = self._details
+        if details is None:
+            if type(self)._build_details is SkogAIError._build_details:
+                return None
+            details = self._details = self._build_details()
+        return details
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Debugging details, built on first access if lazy."""
+        details = self._details
+        if details is None:
+            details = self._details = self._build_details()
+        return details
+
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self._details = value
+        self._str = None
+
+    @property
+    def message(self) -> str:
+        """Human-readable error description."""
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+        self.args = (value,)
+        self._str = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the slot values rather than the constructor arguments.
+
+        The default exception reduction calls type(self)(*self.args), which
+        does not match the subclass signatures, and ignores __slots__.
+        """
+        state: Dict[str, Any] = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in state and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (_new_error, (type(self), self._message), state)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Deprecated alias of details, kept for backward compatibility."""
+        warnings.warn(
+            "SkogAIError.context is deprecated; use .details",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.details
+
+    @property
+    def timestamp(self) -> float:
+        """Wall-clock time (time.time()) recorded on first access.
+
+        Most exceptions are caught and discarded without anyone reading the
+        timestamp, so the clock is only sampled when it is actually needed
+        (e.g. by to_dict()).
+        """
+        ts = self._ts
+        if ts is None:
+            ts = self._ts = _time()
+        return ts
+
+    @property
+    def suggestions(self) -> Tuple[str, ...]:
+        """Actionable hints for resolving this error.
+
+        Suggestions are shared by all instances of a class rather than
+        copied into details on every raise; to_dict() and str() include them.
+        """
+        return self._suggestions
 
     def __str__(self) -> str:
-        """Return string representation with details if available."""
-        if not self.details:
-            return self.message
+        """Return string representation with details if available.
 
-        details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-        # Use "context:" for backward compatibility with existing tests
-        return f"{self.message} (context: {details_str})"
+        The string is built on first use and cached, since tracebacks and
+        test runners may render the same exception several times.
+        """
+        text = self._str
+        if text is None:
+            details = self._peek_details()
+            suggestions = self.suggestions
+            if not details and not suggestions:
+                text = self.message
+            else:
+                # A list comprehension joins faster than a generator here
+                parts = (
+                    ["%s=%s" % (k, _truncate(str(v))) for k, v in details.items()]
+                    if details
+                    else []
+                )
+                if suggestions:
+                    parts.append("suggestions=%s" % _truncate(str(suggestions)))
+                # Use "context:" for backward compatibility with existing tests
+                text = f"{self.message} (context: {', '.join(parts)})"
+            self._str = text
+        return text
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/debugging."""
+        details = self.details
+        suggestions = self.suggestions
+        if suggestions:
+            details = {**details, "suggestions": suggestions}
         return {
-            "error_type": self.__class__.__name__,
-            "message": str(self.message),
-            "details": self.details,
+            "error_type": type(self).__name__,
+            "message": self.message,
+            "details": details,
             "timestamp": self.timestamp,
         }
 
 
+def _new_error(cls: Type[SkogAIError], message: str) -> SkogAIError:
+    """Create an error without running __init__, for unpickling.
+
+    The remaining state is restored from the slot values saved by
+    SkogAIError.__reduce__.
+    """
+    error = cls.__new__(cls)
+    error.args = (message,)
+    return error
+
+
+@contextmanager
+def batched_errors() -> Iterator[List[SkogAIError]]:
+    """Collect errors raised in a block and log them as a single record.
+
+    While the block runs, SkogAIError instances created in the current
+    thread with log_error=True are not logged individually. They are
+    appended to the yielded list and summarized in one ERROR record when
+    the block exits. This turns N handler dispatches into one when many
+    errors are created in a loop.
+
+    Example:
+        >>> with batched_errors() as errors:
+        ...     for key, value in entries.items():
+        ...         try:
+        ...             validate(key, value)
+        ...         except ConfigurationError:
+        ...             pass
+        >>> print(f"{len(errors)} invalid entries")
+    """
+    previous = getattr(_batch_state, "errors", None)
+    errors: List[SkogAIError] = []
+    _batch_state.errors = errors
+    try:
+        yield errors
+    finally:
+        _batch_state.errors = previous
+        if errors:
+            logger = _get_logger()
+            if logger.isEnabledFor(_ERROR):
+                logger.error(
+                    "Batched %d errors: %s",
+                    len(errors),
+                    "; ".join(error.message for error in errors),
+                )
+
+
 class ExecutableNotFoundError(SkogAIError):
     """Raised when a required executable cannot be found in the system PATH.
 
@@ -191,8 +504,20 @@ class ExecutableNotFoundError(SkogAIError):
         ...         return False
         >>> if not is_tool_available("git"):
         ...     print("Git is not installed or not in PATH")
+
+        Reusing instances in a tight probe loop:
+
+        >>> error = ExecutableNotFoundError.get("missing_tool")
+        >>> try:
+        ...     raise error
+        ... except ExecutableNotFoundError as e:
+        ...     e.release()  # Do not use e after this point
     """
 
+    __slots__ = ("executable", "search_paths")
+
+    _suggestions = _EXECUTABLE_NOT_FOUND_SUGGESTIONS
+
     def __init__(
         self,
         executable: str,
@@ -206,25 +531,65 @@ class ExecutableNotFoundError(SkogAIError):
             executable: Name or path of the executable that was not found
             search_paths: List of paths that were searched (optional)
         """
-        details: Dict[str, Any] = {
-            "executable": executable,
-            "suggestions": [
-                "Install the tool using your package manager",
-                "Check if the executable is in your PATH variable",
-                "Use absolute path to the executable",
-                "Verify the executable name is correct",
-            ],
-        }
-        if search_paths:
-            details["search_paths"] = search_paths
-
-        message = f"Executable '{executable}' not found in PATH or specified location"
-        if search_paths:
-            message += f" (searched: {', '.join(search_paths)})"
-
-        super().__init__(message, details, log_error=log_error)
         self.executable = executable
         self.search_paths = search_paths or []
+        # The details are only built on first use
+        self._fast_init(None, None, log_error)
+
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details from the executable and search paths."""
+        if self.search_paths:
+            return {"executable": self.executable, "search_paths": self.search_paths}
+        return {"executable": self.executable}
+
+    def _format_message(self) -> str:
+        """Build the message from the executable and search paths."""
+        if self.search_paths:
+            return _ENF_MSG_SEARCHED % (self.executable, ", ".join(self.search_paths))
+        return _ENF_MSG % self.executable
+
+    @staticmethod
+    def get(
+        executable: str, search_paths: Optional[List[str]] = None
+    ) -> "ExecutableNotFoundError":
+        """Return a non-logging error, reusing a released instance if possible.
+
+        Intended for probes that raise and catch "not found" errors in a
+        loop. Instances are never logged; pass them back with release()
+        once handled to let the next get() on this thread reuse them.
+        """
+        pool = getattr(_enf_pool, "items", None)
+        if pool:
+            error: ExecutableNotFoundError = pool.pop()
+            error._reset(executable, search_paths)
+            return error
+        return ExecutableNotFoundError(executable, search_paths, log_error=False)
+
+    def release(self) -> None:
+        """Return this instance to the calling thread's pool for get().
+
+        The caller must not use the instance afterwards, since a later
+        get() rewrites it in place. Subclass instances are not pooled.
+        """
+        if type(self) is not ExecutableNotFoundError:
+            return
+        pool = getattr(_enf_pool, "items", None)
+        if pool is None:
+            pool = _enf_pool.items = []
+        if len(pool) < _ENF_POOL_SIZE and self not in pool:
+            # Drop frame references so pooled instances keep nothing alive
+            self.__traceback__ = None
+            self.__context__ = None
+            self.__cause__ = None
+            pool.append(self)
+
+    def _reset(self, executable: str, search_paths: Optional[List[str]]) -> None:
+        """Rewrite a pooled instance in place for a new executable."""
+        self.executable = executable
+        self.search_paths = search_paths or []
+        self._details = None
+        self._ts = None
+        self.message = self._format_message()
 
 
 class ExecutionError(SkogAIError):
@@ -283,6 +648,17 @@ class ExecutionError(SkogAIError):
         ...     print(f"Execution time: {e.execution_time:.3f}s")
     """
 
+    __slots__ = (
+        "executable",
+        "exit_code",
+        "command_args",
+        "stdout",
+        "stderr",
+        "execution_time",
+    )
+
+    _suggestions = _EXECUTION_SUGGESTIONS
+
     def __init__(
         self,
         executable: str,
@@ -304,33 +680,7 @@ class ExecutionError(SkogAIError):
             stderr: Standard error from the execution (optional)
             execution_time: Time taken for execution in seconds (optional)
         """
-        details = {
-            "executable": executable,
-            "exit_code": exit_code,
-            "suggestions": [
-                "Check the command arguments for correctness",
-                "Verify input data and file permissions",
-                "Review stderr output for specific error details",
-                "Consult the tool's documentation for exit code meanings",
-            ],
-        }
-
-        if command_args:
-            details["command_args"] = command_args
-        if stdout:
-            details["stdout"] = stdout
-        if stderr:
-            details["stderr"] = stderr
-        if execution_time is not None:
-            details["execution_time"] = execution_time
-
-        cmd_str = executable
-        if command_args:
-            cmd_str += " " + " ".join(command_args)
-
-        message = f"Command '{cmd_str}' failed with exit code {exit_code}"
-
-        super().__init__(message, details, log_error=log_error)
+        # Set before _fast_init, which formats the message from them
         self.executable = executable
         self.exit_code = exit_code
         self.command_args = command_args or []
@@ -338,6 +688,32 @@ class ExecutionError(SkogAIError):
         self.stderr = stderr
         self.execution_time = execution_time
 
+        # The details are only built on first use
+        self._fast_init(None, None, log_error)
+
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details from the stored attributes.
+
+        stdout/stderr can be large; they are kept as attributes only so
+        that formatting or logging the error never re-serializes them.
+        """
+        details: Dict[str, Any] = {
+            "executable": self.executable,
+            "exit_code": self.exit_code,
+        }
+        if self.command_args:
+            details["command_args"] = self.command_args
+        if self.execution_time is not None:
+            details["execution_time"] = self.execution_time
+        return details
+
+    def _format_message(self) -> str:
+        """Build the message from the command line and exit code."""
+        return (
+            f"Command '{_format_cmd(self.executable, self.command_args)}' "
+            f"failed with exit code {self.exit_code}"
+        )
+
 
 class TimeoutError(ExecutionError):
     """Raised when executable execution times out.
@@ -364,6 +740,8 @@ class TimeoutError(ExecutionError):
         partial_stderr: Alias for stderr
     """
 
+    __slots__ = ("timeout", "partial_stdout", "partial_stderr")
+
     def __init__(
         self,
         executable: str,
@@ -386,6 +764,11 @@ class TimeoutError(ExecutionError):
             execution_time: Time elapsed before timeout (optional, defaults to timeout)
             log_error: Whether to log this error (default: True)
         """
+        # Add timeout-specific attributes (the message is built from timeout)
+        self.timeout = timeout
+        self.partial_stdout = partial_stdout
+        self.partial_stderr = partial_stderr
+
         # Properly initialize ExecutionError parent with exit_code=-1 for timeout
         # Map partial outputs to regular outputs for parent class compatibility
         super().__init__(
@@ -397,28 +780,28 @@ class TimeoutError(ExecutionError):
             execution_time=execution_time if execution_time is not None else timeout,
             log_error=log_error,
         )
-        
-        # Override message with timeout-specific format
-        cmd_str = executable
-        if command_args:
-            cmd_str += " " + " ".join(command_args)
-        self.message = f"Command '{cmd_str}' timed out after {timeout} seconds"
-        
-        # Add timeout-specific attributes
-        self.timeout = timeout
-        self.partial_stdout = partial_stdout
-        self.partial_stderr = partial_stderr
-        
-        # Add timeout-specific suggestions to details (prepend to parent's suggestions)
-        timeout_suggestions = [
-            f"Increase timeout (currently {timeout}s)",
-            "Check for hanging processes or infinite loops",
-            "Verify input data doesn't cause processing delays",
-            "Consider breaking large tasks into smaller chunks",
-        ]
-        self.details["timeout"] = timeout
-        self.details["suggestions"] = timeout_suggestions + self.details["suggestions"]
 
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the parent's details plus the exceeded timeout."""
+        details = super()._build_details()
+        details["timeout"] = self.timeout
+        return details
+
+    def _format_message(self) -> str:
+        """Build the timeout-specific message."""
+        return (
+            f"Command '{_format_cmd(self.executable, self.command_args)}' "
+            f"timed out after {self.timeout} seconds"
+        )
+
+    @property
+    def suggestions(self) -> Tuple[str, ...]:
+        """Timeout-specific suggestions followed by ExecutionError's."""
+        return (
+            (f"Increase timeout (currently {self.timeout}s)",)
+            + _TIMEOUT_SUGGESTIONS
+            + _EXECUTION_SUGGESTIONS
+        )
 
 
 class PermissionError(ExecutableNotFoundError):
@@ -429,6 +812,10 @@ class PermissionError(ExecutableNotFoundError):
     lacks the necessary permissions to execute it.
     """
 
+    __slots__ = ("file_mode",)
+
+    _suggestions = _PERMISSION_SUGGESTIONS
+
     def __init__(
         self, executable: str, file_mode: Optional[str] = None, log_error: bool = True
     ) -> None:
@@ -439,25 +826,23 @@ class PermissionError(ExecutableNotFoundError):
             executable: Path to the executable that cannot be executed
             file_mode: File permissions in octal format (optional)
         """
-        details = {
-            "executable": executable,
-            "suggestions": [
-                "Check if the file has execute permissions (chmod +x)",
-                "Run with appropriate privileges (sudo if needed)",
-                "Verify you own the file or have group access",
-                "Check if the file is in a restricted directory",
-            ],
-        }
+        self.executable = executable
+        self.search_paths = []
+        self.file_mode = file_mode
 
-        if file_mode:
-            details["file_mode"] = file_mode
+        # Bypass ExecutableNotFoundError's __init__; the message and details
+        # are built from the attributes above
+        self._fast_init(None, None, log_error)
 
-        message = f"Permission denied: Cannot execute '{executable}'"
+    def _build_details(self) -> Dict[str, Any]:
+        """Build the details from the executable and file mode."""
+        if self.file_mode:
+            return {"executable": self.executable, "file_mode": self.file_mode}
+        return {"executable": self.executable}
 
-        # Call SkogAIError directly to avoid ExecutableNotFoundError's logic
-        SkogAIError.__init__(self, message, details, log_error=log_error)
-        self.executable = executable
-        self.file_mode = file_mode
+    def _format_message(self) -> str:
+        """Build the permission-denied message."""
+        return _PERMISSION_MSG % self.executable
 
 
 class ConfigurationError(SkogAIError):
@@ -504,6 +889,10 @@ class ConfigurationError(SkogAIError):
         ...     # Could suggest creating the directory or using existing path
     """
 
+    __slots__ = ("config_key", "config_value", "valid_values")
+
+    _suggestions = _CONFIGURATION_SUGGESTIONS
+
     def __init__(
         self,
         message: str,
@@ -521,14 +910,7 @@ class ConfigurationError(SkogAIError):
             config_value: The invalid value (optional)
             valid_values: List of valid values (optional)
         """
-        details: Dict[str, Any] = {
-            "suggestions": [
-                "Check configuration file syntax and values",
-                "Verify environment variables are set correctly",
-                "Review parameter combinations for conflicts",
-                "Consult documentation for valid configuration options",
-            ]
-        }
+        details: Dict[str, Any] = {}
         if config_key:
             details["config_key"] = config_key
         if config_value is not None:
@@ -536,7 +918,7 @@ class ConfigurationError(SkogAIError):
         if valid_values:
             details["valid_values"] = valid_values
 
-        super().__init__(message, details, log_error=log_error)
+        self._fast_init(message, details, log_error)
         self.config_key = config_key
         self.config_value = config_value
         self.valid_values = valid_values or []
@@ -62,24 +62,121 @@ Advanced Usage:
     Exit code: 1
 """
 
-import subprocess
+import codecs
+import errno
+import locale
+import logging
+import os
+import shutil
+import stat
+import sys
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Dict, Union, List
-from dataclasses import dataclass
-
-from .exceptions import ExecutableNotFoundError, ExecutionError, ConfigurationError
-from .logging_config import get_logger, get_performance_logger
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Optional,
+    Dict,
+    Tuple,
+    TypeVar,
+    Union,
+    List,
+    cast,
+    Mapping,
+    Sequence,
+)
+
+from .exceptions import (
+    ExecutableNotFoundError,
+    ExecutionError,
+    ConfigurationError,
+    SkogAIError,
+)
+from .logging_config import get_logger
 
 
 logger = get_logger("executable")
 
+# Per-run timing is reported on the performance logger, like
+# get_performance_logger(), but without a context manager per call
+_perf_logger = get_logger("performance")
+_PERF_THRESHOLD_MS = 10.0
+
+# subprocess (and the select/signal modules it pulls in) is imported by the
+# first run_executable() call, not when skoglib is imported
+if TYPE_CHECKING:
+    import subprocess as _subprocess
+else:
+    _subprocess = None
+
+_T = TypeVar("_T")
+
+# Read size used when draining pipes for max_output_bytes
+_READ_SIZE = 65536
+
+
+def _pipesize_from_env() -> int:
+    """Return the pipe buffer size requested via SKOGLIB_PIPESIZE, or 0."""
+    raw = os.environ.get("SKOGLIB_PIPESIZE")
+    if not raw:
+        return 0
+    try:
+        size = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid SKOGLIB_PIPESIZE: %r", raw)
+        return 0
+    return max(size, 0)
+
+
+# Kernel pipe buffer requested for captured output (Python 3.10+, Linux).
+# A wider pipe lets a chatty child write more before it blocks on us. Off by
+# default (0 keeps the system default); opt in with SKOGLIB_PIPESIZE=<bytes>.
+_PIPESIZE = _pipesize_from_env()
+_PIPE_KWARGS: Dict[str, Any] = (
+    {"pipesize": _PIPESIZE} if _PIPESIZE and sys.version_info >= (3, 10) else {}
+)
+
+
+def _spawn(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Call subprocess.run/Popen with the configured pipe size.
+
+    Raising the pipe size fails with EPERM once the user is past
+    fs.pipe-user-pages-soft (or EBUSY while pipes are in use). That happens
+    before the child is started, so the call is retried without it and the
+    pipe size is not requested again.
+    """
+    global _PIPE_KWARGS
+    if _PIPE_KWARGS:
+        try:
+            return func(*args, **kwargs, **_PIPE_KWARGS)
+        except OSError as e:
+            if e.errno not in (errno.EPERM, errno.EBUSY):
+                raise
+            logger.debug("Pipe size %d rejected (%s); using default", _PIPESIZE, e)
+            _PIPE_KWARGS = {}
+    return func(*args, **kwargs)
+
+
+def _decode_output(data: bytes, encoding: Optional[str] = None) -> str:
+    """Decode captured output the way subprocess text mode would.
+
+    Uses `encoding` (the locale's preferred encoding by default) and
+    translates newlines, but replaces undecodable bytes instead of failing.
+    """
+    text = data.decode(encoding or locale.getpreferredencoding(False), errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
-@dataclass
 class ExecutionResult:
     """Result of an executable run operation.
 
-    This dataclass encapsulates all information about an executable's execution,
+    This class encapsulates all information about an executable's execution,
     providing structured access to output, timing, metadata, and convenience
     properties for common analysis patterns.
 
@@ -92,9 +189,15 @@ class ExecutionResult:
         executable: Name or path of the executed command
         args: List of arguments passed to the executable
         exit_code: Process exit code (0 indicates success)
-        stdout: Standard output captured from the execution
-        stderr: Standard error output captured from the execution
-        execution_time: Wall-clock time taken for execution in seconds
+        stdout: Standard output captured from the execution (decoded on
+            first access)
+        stderr: Standard error output captured from the execution (decoded
+            on first access)
+        stdout_bytes: Raw captured stdout when the run used
+            ``binary_output=True``, otherwise None
+        stderr_bytes: Raw captured stderr when the run used
+            ``binary_output=True``, otherwise None
+        execution_time: Monotonic wall-clock time taken for execution in seconds
         cwd: Working directory used for execution (None if current directory)
         env_vars: Additional environment variables set for execution
 
@@ -124,14 +227,110 @@ class ExecutionResult:
         Command failed with code 1
     """
 
-    executable: str
-    args: List[str]
-    exit_code: int
-    stdout: str
-    stderr: str
-    execution_time: float
-    cwd: Optional[str] = None
-    env_vars: Optional[Dict[str, str]] = None
+    __slots__ = (
+        "executable",
+        "args",
+        "exit_code",
+        "_stdout",
+        "_stderr",
+        "execution_time",
+        "cwd",
+        "env_vars",
+        "_encoding",
+        "_stdout_bytes",
+        "_stderr_bytes",
+    )
+
+    def __init__(
+        self,
+        executable: str,
+        args: List[str],
+        exit_code: int,
+        stdout: Union[str, bytes],
+        stderr: Union[str, bytes],
+        execution_time: float,
+        cwd: Optional[str] = None,
+        env_vars: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        binary: bool = False,
+    ) -> None:
+        self.executable = executable
+        self.args = args
+        self.exit_code = exit_code
+        # Raw bytes are kept as-is and only decoded if the output is read
+        self._stdout: Union[str, bytes] = stdout
+        self._stderr: Union[str, bytes] = stderr
+        self.execution_time = execution_time
+        self.cwd = cwd
+        self.env_vars = env_vars
+        self._encoding = encoding
+        # Binary runs also keep the undecoded output for stdout_bytes
+        self._stdout_bytes = stdout if binary and isinstance(stdout, bytes) else None
+        self._stderr_bytes = stderr if binary and isinstance(stderr, bytes) else None
+
+    @property
+    def stdout(self) -> str:
+        """Standard output, decoded on first access."""
+        out = self._stdout
+        if isinstance(out, bytes):
+            out = self._stdout = _decode_output(out, self._encoding)
+        return out
+
+    @stdout.setter
+    def stdout(self, value: str) -> None:
+        self._stdout = value
+
+    @property
+    def stderr(self) -> str:
+        """Standard error, decoded on first access."""
+        err = self._stderr
+        if isinstance(err, bytes):
+            err = self._stderr = _decode_output(err, self._encoding)
+        return err
+
+    @stderr.setter
+    def stderr(self, value: str) -> None:
+        self._stderr = value
+
+    @property
+    def stdout_bytes(self) -> Optional[bytes]:
+        """Raw standard output for ``binary_output=True`` runs, else None."""
+        return self._stdout_bytes
+
+    @property
+    def stderr_bytes(self) -> Optional[bytes]:
+        """Raw standard error for ``binary_output=True`` runs, else None."""
+        return self._stderr_bytes
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return (
+            self.executable,
+            self.args,
+            self.exit_code,
+            self.stdout,
+            self.stderr,
+            self._stdout_bytes,
+            self._stderr_bytes,
+            self.execution_time,
+            self.cwd,
+            self.env_vars,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExecutionResult):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(executable={self.executable!r}, "
+            f"args={self.args!r}, exit_code={self.exit_code!r}, "
+            f"stdout={self.stdout!r}, stderr={self.stderr!r}, "
+            f"execution_time={self.execution_time!r}, cwd={self.cwd!r}, "
+            f"env_vars={self.env_vars!r})"
+        )
 
     @property
     def success(self) -> bool:
@@ -181,6 +380,9 @@ def _find_executable(executable: Union[str, Path]) -> str:
     It supports both absolute paths (which are validated for existence and execute
     permissions) and relative names (which are searched in the system PATH).
 
+    Absolute paths are validated with a single stat() call on every use.
+    Names searched in PATH are cached by _which_cached.
+
     Args:
         executable: Name or path of executable to find. Can be string or Path object.
 
@@ -203,34 +405,256 @@ def _find_executable(executable: Union[str, Path]) -> str:
         ExecutableNotFoundError: Executable 'nonexistent' not found in paths: ...
     """
     # Convert to string for consistent handling
-    exec_str = str(executable)
+    exec_str = os.fspath(executable)
 
     # If it's an absolute path, check if it exists and is executable
-    if Path(exec_str).is_absolute():
-        exe_path = Path(exec_str)
-        if not exe_path.exists():
-            raise ExecutableNotFoundError(exec_str)
-        if not exe_path.is_file():
-            raise ExecutableNotFoundError(exec_str, search_paths=[str(exe_path.parent)])
-        if not exe_path.stat().st_mode & 0o111:  # Check execute permission
-            raise ExecutableNotFoundError(exec_str, search_paths=[str(exe_path.parent)])
-        return str(exe_path)
+    if os.path.isabs(exec_str):
+        # One stat() answers exists / is-a-file / has-execute-bits at once
+        try:
+            mode = os.stat(exec_str).st_mode
+        except OSError:
+            raise ExecutableNotFoundError(exec_str) from None
+        if not stat.S_ISREG(mode) or not mode & 0o111:
+            raise ExecutableNotFoundError(
+                exec_str, search_paths=[os.path.dirname(exec_str)]
+            )
+        return exec_str
 
     # Search in PATH
-    import shutil
-
-    exe_path_str = shutil.which(exec_str)
+    environ = os.environ
+    path_env = environ.get("PATH")
+    exe_path_str = _which_cached(exec_str, path_env, environ.get("PATHEXT"))
     if exe_path_str is None:
         # Get PATH for context
-        import os
-
-        path_env = os.environ.get("PATH", "")
         search_paths = path_env.split(os.pathsep) if path_env else []
         raise ExecutableNotFoundError(exec_str, search_paths)
 
     return exe_path_str
 
 
+# Successful PATH lookups keyed on (name, PATH, PATHEXT). Misses are never
+# stored, so a tool installed after a failed lookup is found next time.
+_which_cache: Dict[Tuple[str, Optional[str], Optional[str]], str] = {}
+_WHICH_CACHE_SIZE = 256
+
+
+def _which_cached(
+    executable: str, path_env: Optional[str], pathext_env: Optional[str]
+) -> Optional[str]:
+    """Memoized shutil.which lookup.
+
+    PATH and PATHEXT are part of the cache key, so changing either one
+    triggers a fresh search. A remembered hit is re-checked before it is
+    returned and forgotten once it is no longer an executable file.
+    """
+    key = (executable, path_env, pathext_env)
+    cached = _which_cache.get(key)
+    if cached is not None:
+        if os.path.isfile(cached) and os.access(cached, os.X_OK):
+            return cached
+        _which_cache.pop(key, None)
+
+    found = shutil.which(executable, path=path_env)
+    if found is not None:
+        if len(_which_cache) >= _WHICH_CACHE_SIZE:
+            _which_cache.pop(next(iter(_which_cache)), None)
+        _which_cache[key] = found
+    return found
+
+
+def _exec_err(
+    executable: str,
+    code: int,
+    args: List[str],
+    out: Optional[str],
+    err: Optional[str],
+    t: float,
+) -> ExecutionError:
+    """Build the ExecutionError raised by run_executable, positionally."""
+    return ExecutionError(executable, code, args, out, err, t)
+
+
+def _error_text(data: Union[str, bytes], encoding: Optional[str]) -> str:
+    """Return captured output as text for an ExecutionError."""
+    if isinstance(data, bytes):
+        return _decode_output(data, encoding)
+    return data
+
+
+def _run_uncaptured(
+    command: List[str],
+    cwd: Optional[str],
+    env: Optional[Dict[str, str]],
+    timeout: Optional[float],
+) -> int:
+    """Run command with inherited stdout/stderr and return its exit code.
+
+    Mirrors subprocess.run() on timeout: the child is killed and reaped
+    before TimeoutExpired propagates.
+    """
+    with _subprocess.Popen(command, cwd=cwd, env=env) as proc:
+        try:
+            return proc.wait(timeout=timeout)
+        except _subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+
+
+def _prepare_run(
+    executable: Union[str, Path],
+    args: Optional[List[str]],
+    cwd: Optional[Union[str, Path]],
+    env_vars: Optional[Dict[str, str]],
+    timeout: Optional[float],
+    encoding: Optional[str] = None,
+) -> Tuple[str, List[str], List[str], Optional[str], Optional[Dict[str, str]]]:
+    """Validate run arguments shared by run_executable and its async variant.
+
+    Returns:
+        Tuple of (exe_name, args, command, work_dir, env) ready to hand to
+        the process launcher. exe_name is `executable` as a string,
+        converted once here for every later use.
+
+    Raises:
+        ConfigurationError: If args, timeout, encoding or cwd are invalid.
+        ExecutableNotFoundError: If the executable cannot be resolved.
+    """
+    # Validate and normalize parameters
+    args = args or []
+
+    # Exact-type check first; isinstance() only runs for list subclasses
+    # and invalid input
+    if args.__class__ is not list and not isinstance(args, list):
+        raise ConfigurationError(
+            "args must be a list of strings",
+            config_key="args",
+            config_value=type(args).__name__,
+        )
+
+    if timeout is not None and timeout <= 0:
+        raise ConfigurationError(
+            "timeout must be positive",
+            config_key="timeout",
+            config_value=timeout,
+            valid_values=["positive float/int"],
+        )
+
+    # Output is decoded lazily, so catch an unknown codec before the run
+    if encoding is not None:
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            raise ConfigurationError(
+                f"Unknown encoding: {encoding}",
+                config_key="encoding",
+                config_value=encoding,
+            ) from None
+
+    # Find and validate executable
+    exe_name = os.fspath(executable)
+    executable_path = _find_executable(exe_name)
+
+    # Prepare working directory
+    work_dir: Optional[str] = None
+    if cwd:
+        work_dir = os.fspath(cwd)
+        if not os.path.isdir(work_dir):
+            raise ConfigurationError(
+                f"Working directory does not exist: {work_dir}",
+                config_key="cwd",
+                config_value=work_dir,
+            )
+
+    # Prepare environment; None lets the child inherit ours without copying it
+    env = {**os.environ, **env_vars} if env_vars else None
+
+    # Build command
+    command = [executable_path, *args]
+
+    return exe_name, args, command, work_dir, env
+
+
+def _check_max_output_bytes(max_output_bytes: Optional[int]) -> None:
+    """Reject a negative max_output_bytes with ConfigurationError."""
+    if max_output_bytes is not None and max_output_bytes < 0:
+        raise ConfigurationError(
+            "max_output_bytes must not be negative",
+            config_key="max_output_bytes",
+            config_value=max_output_bytes,
+            valid_values=["non-negative int", "None"],
+        )
+
+
+def _run_bounded(
+    command: List[str],
+    cwd: Optional[str],
+    env: Optional[Dict[str, str]],
+    timeout: Optional[float],
+    limit: int,
+) -> Tuple[int, bytes, bytes]:
+    """Run command, keeping only the last `limit` bytes of stdout and stderr.
+
+    Both pipes are drained as data arrives, so the child never stalls on a
+    full pipe and memory stays bounded however much it writes. On timeout
+    the child is killed and TimeoutExpired carries the retained output.
+    Relies on select()-able pipes, so it is POSIX only.
+    """
+    import selectors
+
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    pipe = _subprocess.PIPE
+    with _spawn(
+        _subprocess.Popen, command, cwd=cwd, env=env, stdout=pipe, stderr=pipe
+    ) as proc:
+        out_fd = cast(IO[bytes], proc.stdout).fileno()
+        err_fd = cast(IO[bytes], proc.stderr).fileno()
+        chunks: Dict[int, Deque[bytes]] = {out_fd: deque(), err_fd: deque()}
+        sizes = {out_fd: 0, err_fd: 0}
+
+        def tail(fd: int) -> bytes:
+            data = b"".join(chunks[fd])
+            return data[max(len(data) - limit, 0) :]
+
+        def expire() -> None:
+            proc.kill()
+            proc.wait()
+            raise _subprocess.TimeoutExpired(
+                command, cast(float, timeout), output=tail(out_fd), stderr=tail(err_fd)
+            )
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(out_fd, selectors.EVENT_READ)
+            selector.register(err_fd, selectors.EVENT_READ)
+            remaining = None
+            while selector.get_map():
+                if deadline is not None:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        expire()
+                for key, _ in selector.select(remaining):
+                    fd = key.fd
+                    chunk = os.read(fd, _READ_SIZE)
+                    if not chunk:
+                        selector.unregister(fd)
+                        continue
+                    buf = chunks[fd]
+                    buf.append(chunk)
+                    size = sizes[fd] + len(chunk)
+                    # Drop whole chunks the tail no longer needs
+                    while buf and size - len(buf[0]) >= limit:
+                        size -= len(buf.popleft())
+                    sizes[fd] = size
+
+        try:
+            returncode = proc.wait(
+                timeout=None if deadline is None else deadline - time.perf_counter()
+            )
+        except _subprocess.TimeoutExpired:
+            expire()
+        return returncode, tail(out_fd), tail(err_fd)
+
+
 def run_executable(
     executable: Union[str, Path],
     args: Optional[List[str]] = None,
@@ -239,6 +663,9 @@ def run_executable(
     timeout: Optional[float] = None,
     capture_output: bool = True,
     check_exit_code: bool = True,
+    max_output_bytes: Optional[int] = None,
+    binary_output: bool = False,
+    encoding: Optional[str] = None,
 ) -> ExecutionResult:
     """Run a skoglib executable with specified arguments and environment.
 
@@ -261,6 +688,16 @@ def run_executable(
             be printed directly to console and not captured in the result.
         check_exit_code: Whether to raise ExecutionError on non-zero exit codes.
             If False, failed executions return a result with success=False.
+        max_output_bytes: Keep only the last this many bytes of stdout and of
+            stderr. Both pipes are drained while the process runs, so peak
+            memory stays bounded for commands that write a lot of output.
+            None (the default) keeps everything. POSIX only.
+        binary_output: Also keep the raw captured bytes, available as
+            result.stdout_bytes and result.stderr_bytes. Useful when the
+            output is fed to another binary tool. stdout and stderr stay
+            text, decoded only if they are read.
+        encoding: Encoding used to decode stdout/stderr. Defaults to the
+            locale's preferred encoding, like subprocess text mode.
 
     Returns:
         ExecutionResult containing exit code, output, timing information, and
@@ -318,121 +755,655 @@ def run_executable(
         >>> print(f"Success: {result.success}, Exit code: {result.exit_code}")
         Success: False, Exit code: 1
     """
-    # Validate and normalize parameters
-    args = args or []
+    global _subprocess
+    if not TYPE_CHECKING and _subprocess is None:
+        import subprocess as _subprocess
+
+    exe_name, args, command, work_dir, env = _prepare_run(
+        executable, args, cwd, env_vars, timeout, encoding
+    )
+
+    _check_max_output_bytes(max_output_bytes)
+
+    # Checked once per call; the debug messages below are only built if needed
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Executing: %s", " ".join(command))
+        if work_dir:
+            logger.debug("Working directory: %s", work_dir)
+        if env_vars:
+            logger.debug("Additional env vars: %s", list(env_vars))
+
+    # Process creation: command[0] is always an absolute path and we never
+    # pass shell, preexec_fn, pass_fds, start_new_session or process_group.
+    # That keeps subprocess on its cheapest spawn path (posix_spawn when no
+    # cwd is given on recent Pythons, vfork otherwise) instead of a full
+    # fork() that copies the parent's page tables; keep it that way.
+
+    # Execute with timing and performance logging. perf_counter is
+    # monotonic, so NTP adjustments cannot skew the measured duration.
+    start_time = time.perf_counter()
+
+    try:
+        stdout: Union[str, bytes]
+        stderr: Union[str, bytes]
+        if capture_output and max_output_bytes is None:
+            result = _spawn(
+                _subprocess.run,
+                command,
+                cwd=work_dir,
+                env=env,
+                capture_output=True,
+                timeout=timeout,
+            )
+            returncode = result.returncode
+            stdout = result.stdout
+            stderr = result.stderr
+        elif capture_output and max_output_bytes is not None:
+            returncode, stdout, stderr = _run_bounded(
+                command, work_dir, env, timeout, max_output_bytes
+            )
+        else:
+            # Nothing to capture: start the process and just wait for it,
+            # without run()'s communicate() step
+            returncode = _run_uncaptured(command, work_dir, env, timeout)
+            stdout = stderr = b""
+        execution_time = time.perf_counter() - start_time
+
+        if debug:
+            logger.debug(
+                "Execution completed in %.3fs with exit code %d",
+                execution_time,
+                returncode,
+            )
 
-    if not isinstance(args, list):
-        raise ConfigurationError(
-            "args must be a list of strings",
-            config_key="args",
-            config_value=type(args).__name__,
+        # Create result object (positional: this runs on every call).
+        # cwd/env_vars are None unless the caller supplied them.
+        exec_result = ExecutionResult(
+            exe_name,
+            args,
+            returncode,
+            stdout,
+            stderr,
+            execution_time,
+            work_dir,
+            env_vars or None,
+            encoding,
+            binary_output,
         )
 
-    if timeout is not None and timeout <= 0:
-        raise ConfigurationError(
-            "timeout must be positive",
-            config_key="timeout",
-            config_value=timeout,
-            valid_values=["positive float/int"],
-        )
+        # Check for execution errors
+        if check_exit_code and returncode != 0:
+            if capture_output:
+                raise _exec_err(
+                    exec_result.executable,
+                    returncode,
+                    args,
+                    _error_text(stdout, encoding),
+                    _error_text(stderr, encoding),
+                    execution_time,
+                )
+            raise _exec_err(
+                exec_result.executable, returncode, args, None, None, execution_time
+            )
 
-    # Find and validate executable
-    executable_path = _find_executable(executable)
+        return exec_result
+
+    except _subprocess.TimeoutExpired as e:
+        execution_time = time.perf_counter() - start_time
+        logger.warning("Command timed out after %.3fs", execution_time)
+
+        # Exit code -1 indicates a timeout
+        raise _exec_err(
+            exe_name,
+            -1,
+            args,
+            _decode_output(e.stdout, encoding) if e.stdout else None,
+            _decode_output(e.stderr, encoding) if e.stderr else None,
+            execution_time,
+        ) from e
+
+    except OSError as e:
+        execution_time = time.perf_counter() - start_time
+        logger.error("OS error during execution: %s", e)
+
+        # This might be a permission issue or other OS-level problem;
+        # exit code -2 indicates an OS error
+        raise _exec_err(exe_name, -2, args, None, str(e), execution_time) from e
+
+    finally:
+        if _perf_logger.isEnabledFor(logging.DEBUG):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            if duration_ms >= _PERF_THRESHOLD_MS:
+                _perf_logger.debug(
+                    "execute_%s completed in %.2fms", exe_name, duration_ms
+                )
 
-    # Prepare working directory
-    work_dir: Optional[str] = None
-    if cwd:
-        work_dir_path = Path(cwd)
-        if not work_dir_path.exists():
-            raise ConfigurationError(
-                f"Working directory does not exist: {work_dir_path}",
-                config_key="cwd",
-                config_value=str(work_dir_path),
-            )
-        work_dir = str(work_dir_path)
 
-    # Prepare environment
-    import os
+def run_executable_quick(
+    resolved_path: str, args: Tuple[str, ...] = (), timeout: Optional[float] = None
+) -> Tuple[int, str, str]:
+    """Run an already-resolved executable with no validation or bookkeeping.
 
-    env = os.environ.copy()
-    if env_vars:
-        env.update(env_vars)
+    A specialised fast path for trusted callers that invoke the same tool
+    many times: no PATH lookup, no argument checks, no environment copy, no
+    ExecutionResult and no logging. The caller is responsible for passing
+    an absolute path, e.g. one returned by `skoglib.find_executable` once
+    up front.
 
-    # Build command
-    command = [executable_path] + args
+    Args:
+        resolved_path: Absolute path of the executable.
+        args: Command-line arguments.
+        timeout: Maximum execution time in seconds.
 
-    logger.debug(f"Executing: {' '.join(command)}")
-    if work_dir:
-        logger.debug(f"Working directory: {work_dir}")
-    if env_vars:
-        logger.debug(f"Additional env vars: {list(env_vars.keys())}")
+    Returns:
+        Tuple of (exit_code, stdout, stderr). A non-zero exit code is
+        returned, not raised.
+
+    Raises:
+        subprocess.TimeoutExpired: If the timeout expires.
+        OSError: If the process cannot be started.
+    """
+    global _subprocess
+    if not TYPE_CHECKING and _subprocess is None:
+        import subprocess as _subprocess
+
+    result: "_subprocess.CompletedProcess[bytes]" = _spawn(
+        _subprocess.run, (resolved_path, *args), capture_output=True, timeout=timeout
+    )
+    return (
+        result.returncode,
+        _decode_output(result.stdout),
+        _decode_output(result.stderr),
+    )
+
+
+def run_many(
+    specs: Sequence[Mapping[str, Any]],
+    *,
+    max_workers: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Union[ExecutionResult, SkogAIError]]:
+    """Run several executables concurrently on a thread pool.
+
+    Each spec is a mapping of `run_executable` keyword arguments. Threads
+    spend nearly all their time waiting on their child process, so the
+    total wall-clock time follows the slowest command rather than the sum.
+
+    Args:
+        specs: One mapping of run_executable arguments per command.
+        max_workers: Maximum number of commands running at once. Defaults
+            to min(32, cpu_count * 4).
+        return_exceptions: If True, a failed command's SkogAIError is
+            returned in its slot instead of being raised.
 
-    # Execute with timing and performance logging
-    start_time = time.time()
+    Returns:
+        One entry per spec, in the same order as `specs`.
+
+    Raises:
+        SkogAIError: The first failure in spec order, once every command
+            has finished, unless return_exceptions is True.
+
+    Example:
+        >>> results = run_many([
+        ...     {"executable": "echo", "args": ["one"]},
+        ...     {"executable": "echo", "args": ["two"]},
+        ... ])
+        >>> [r.stdout.strip() for r in results]
+        ['one', 'two']
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not specs:
+        return []
 
-    with get_performance_logger(f"execute_{executable}"):
+    def run(spec: Mapping[str, Any]) -> Union[ExecutionResult, SkogAIError]:
         try:
-            result = subprocess.run(
-                command,
-                cwd=work_dir,
-                env=env,
-                capture_output=capture_output,
-                text=True,
-                timeout=timeout,
+            return run_executable(**spec)
+        except SkogAIError as e:
+            return e
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=min(workers, len(specs))) as executor:
+        results = list(executor.map(run, specs))
+
+    if not return_exceptions:
+        for result in results:
+            if isinstance(result, SkogAIError):
+                raise result
+    return results
+
+
+async def _read_stream(
+    stream: Any, chunks: Deque[bytes], limit: Optional[int]
+) -> None:
+    """Read an asyncio stream to EOF into chunks, keeping about `limit` bytes.
+
+    With a limit, whole chunks the tail no longer needs are dropped as
+    data arrives, so memory stays bounded however much the child writes.
+    """
+    size = 0
+    while True:
+        chunk = await stream.read(_READ_SIZE)
+        if not chunk:
+            return
+        chunks.append(chunk)
+        if limit is not None:
+            size += len(chunk)
+            while chunks and size - len(chunks[0]) >= limit:
+                size -= len(chunks.popleft())
+
+
+def _tail(chunks: Deque[bytes], limit: Optional[int]) -> bytes:
+    """Join chunks, keeping only the last `limit` bytes if a limit is set."""
+    data = b"".join(chunks)
+    if limit is None:
+        return data
+    return data[max(len(data) - limit, 0) :]
+
+
+async def run_executable_async(
+    executable: Union[str, Path],
+    args: Optional[List[str]] = None,
+    cwd: Optional[Union[str, Path]] = None,
+    env_vars: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    capture_output: bool = True,
+    check_exit_code: bool = True,
+    max_output_bytes: Optional[int] = None,
+    binary_output: bool = False,
+    encoding: Optional[str] = None,
+) -> ExecutionResult:
+    """Run an executable without blocking the event loop.
+
+    Takes the same arguments, returns the same result and raises the same
+    exceptions as `run_executable`, but launches the child with
+    `asyncio.create_subprocess_exec`. Several executables can therefore
+    run concurrently on one event loop, and the total wall-clock time
+    follows the slowest command instead of the sum of all of them. As with
+    `run_executable`, output captured before a timeout is attached to the
+    ExecutionError.
+
+    Examples:
+        Running commands concurrently:
+
+        >>> import asyncio
+        >>> async def main():
+        ...     return await asyncio.gather(
+        ...         run_executable_async("echo", ["one"]),
+        ...         run_executable_async("echo", ["two"]),
+        ...     )
+        >>> [r.stdout.strip() for r in asyncio.run(main())]
+        ['one', 'two']
+    """
+    import asyncio
+
+    exe_name, args, command, work_dir, env = _prepare_run(
+        executable, args, cwd, env_vars, timeout, encoding
+    )
+    _check_max_output_bytes(max_output_bytes)
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Executing (async): %s", " ".join(command))
+
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    out_chunks: Deque[bytes] = deque()
+    err_chunks: Deque[bytes] = deque()
+    start_time = time.perf_counter()
+
+    try:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command, cwd=work_dir, env=env, stdout=pipe, stderr=pipe
+            )
+        except OSError as e:
+            execution_time = time.perf_counter() - start_time
+            logger.error("OS error during execution: %s", e)
+            raise _exec_err(exe_name, -2, args, None, str(e), execution_time) from e
+
+        # The readers append to the chunk buffers as data arrives, so
+        # whatever was read before a timeout is still there afterwards
+        communicate: Awaitable[Any]
+        if capture_output:
+            communicate = asyncio.gather(
+                _read_stream(proc.stdout, out_chunks, max_output_bytes),
+                _read_stream(proc.stderr, err_chunks, max_output_bytes),
+                proc.wait(),
             )
-            execution_time = time.time() - start_time
+        else:
+            communicate = proc.wait()
 
+        try:
+            await asyncio.wait_for(communicate, timeout)
+        except asyncio.TimeoutError:
+            # Reap the child before reporting, as subprocess.run() does
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            execution_time = time.perf_counter() - start_time
+            logger.warning("Command timed out after %.3fs", execution_time)
+            partial_out = _tail(out_chunks, max_output_bytes)
+            partial_err = _tail(err_chunks, max_output_bytes)
+            raise _exec_err(
+                exe_name,
+                -1,
+                args,
+                _decode_output(partial_out, encoding) if partial_out else None,
+                _decode_output(partial_err, encoding) if partial_err else None,
+                execution_time,
+            ) from None
+        except BaseException:
+            # Cancellation or any other escape must not leave the child
+            # running behind us
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            raise
+        execution_time = time.perf_counter() - start_time
+
+        stdout: Union[str, bytes]
+        stderr: Union[str, bytes]
+        if capture_output:
+            stdout = _tail(out_chunks, max_output_bytes)
+            stderr = _tail(err_chunks, max_output_bytes)
+        else:
+            stdout = stderr = b""
+
+        # The child has been reaped, so this returns its exit code at once
+        returncode = await proc.wait()
+        if debug:
             logger.debug(
-                f"Execution completed in {execution_time:.3f}s with exit code {result.returncode}"
+                "Execution completed in %.3fs with exit code %d",
+                execution_time,
+                returncode,
             )
 
-            # Create result object
-            exec_result = ExecutionResult(
-                executable=str(executable),
-                args=args,
-                exit_code=result.returncode,
-                stdout=result.stdout if capture_output else "",
-                stderr=result.stderr if capture_output else "",
-                execution_time=execution_time,
-                cwd=work_dir,
-                env_vars=env_vars,
+        exec_result = ExecutionResult(
+            exe_name,
+            args,
+            returncode,
+            stdout,
+            stderr,
+            execution_time,
+            work_dir,
+            env_vars or None,
+            encoding,
+            binary_output,
+        )
+
+        if check_exit_code and returncode != 0:
+            if capture_output:
+                raise _exec_err(
+                    exec_result.executable,
+                    returncode,
+                    args,
+                    _error_text(stdout, encoding),
+                    _error_text(stderr, encoding),
+                    execution_time,
+                )
+            raise _exec_err(
+                exec_result.executable, returncode, args, None, None, execution_time
             )
 
-            # Check for execution errors
-            if check_exit_code and result.returncode != 0:
-                raise ExecutionError(
-                    executable=str(executable),
-                    exit_code=result.returncode,
-                    command_args=args,
-                    stdout=result.stdout if capture_output else None,
-                    stderr=result.stderr if capture_output else None,
-                    execution_time=execution_time,
+        return exec_result
+
+    finally:
+        if _perf_logger.isEnabledFor(logging.DEBUG):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            if duration_ms >= _PERF_THRESHOLD_MS:
+                _perf_logger.debug(
+                    "execute_%s completed in %.2fms", exe_name, duration_ms
                 )
 
-            return exec_result
 
-        except subprocess.TimeoutExpired as e:
-            execution_time = time.time() - start_time
-            logger.warning(f"Command timed out after {execution_time:.3f}s")
+class ExecutablePool:
+    """A long-lived worker process that serves repeated requests.
 
-            raise ExecutionError(
-                executable=str(executable),
-                exit_code=-1,  # Use -1 to indicate timeout
-                command_args=args,
-                stdout=e.stdout.decode("utf-8") if e.stdout and isinstance(e.stdout, bytes) else None,
-                stderr=e.stderr.decode("utf-8") if e.stderr and isinstance(e.stderr, bytes) else None,
-                execution_time=execution_time,
-            ) from e
+    Starting a process costs a fork/exec plus the tool's own startup, which
+    dominates when the same interpreter or formatter is invoked many times.
+    ExecutablePool starts the worker once and sends each request over its
+    stdin, so that cost is paid once for N calls.
 
-        except OSError as e:
-            execution_time = time.time() - start_time
-            logger.error(f"OS error during execution: {e}")
-
-            # This might be a permission issue or other OS-level problem
-            raise ExecutionError(
-                executable=str(executable),
-                exit_code=-2,  # Use -2 to indicate OS error
-                command_args=args,
-                stderr=str(e),
-                execution_time=execution_time,
-            ) from e
+    The worker must speak a length-prefixed protocol: it reads a 4-byte
+    little-endian length followed by that many payload bytes from stdin, and
+    answers with a 4-byte little-endian length followed by the response on
+    stdout. Only use it with stateless workers, where handling one request
+    cannot affect the next. Requests are serialized with a lock, so a pool
+    may be shared between threads.
+
+    A request that is not answered within the timeout, or a worker that
+    exits or closes its output mid-response, raises ExecutionError; the
+    worker is then killed and a fresh one started, so the pool stays
+    usable. Relies on select()-able pipes, so it is POSIX only.
+
+    Examples:
+        >>> worker = "import sys; ..."  # doctest: +SKIP
+        >>> with ExecutablePool("python3", ["-c", worker]) as pool:  # doctest: +SKIP
+        ...     result = pool.submit(b"payload")
+        ...     print(result.stdout_bytes)
+    """
+
+    def __init__(
+        self,
+        executable: Union[str, Path],
+        args_prefix: Optional[List[str]] = None,
+        cwd: Optional[Union[str, Path]] = None,
+        env_vars: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Start the worker.
+
+        Args:
+            executable: Worker executable, resolved like run_executable's.
+            args_prefix: Arguments the worker is started with.
+            cwd: Working directory for the worker.
+            env_vars: Environment variables added to the worker's environment.
+            timeout: Default seconds submit() waits for a response, or None
+                to wait indefinitely.
+        """
+        global _subprocess
+        if not TYPE_CHECKING and _subprocess is None:
+            import subprocess as _subprocess
+
+        exe_name, args, command, work_dir, env = _prepare_run(
+            executable, args_prefix, cwd, env_vars, timeout
+        )
+        self.executable = exe_name
+        self.args = args
+        self.timeout = timeout
+        self._command = command
+        self._work_dir = work_dir
+        self._env = env
+        self._closed = False
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self) -> None:
+        """Start a worker process and bind its pipes."""
+        pipe = _subprocess.PIPE
+        # Unbuffered: requests and responses go straight through the fds
+        self._proc: "_subprocess.Popen[bytes]" = _spawn(
+            _subprocess.Popen,
+            self._command,
+            cwd=self._work_dir,
+            env=self._env,
+            stdin=pipe,
+            stdout=pipe,
+            bufsize=0,
+        )
+        self._stdin = cast(IO[bytes], self._proc.stdin)
+        self._stdout = cast(IO[bytes], self._proc.stdout)
+        # Writes must not block past the deadline either
+        os.set_blocking(self._stdin.fileno(), False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Started pool worker %d: %s", self._proc.pid, self._command)
+
+    def _restart(self) -> None:
+        """Kill the current worker and start a fresh one."""
+        proc = self._proc
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        proc.wait()
+        self._stdin.close()
+        self._stdout.close()
+        self._start()
+
+    def _transfer(self, request: bytes, deadline: Optional[float]) -> bytes:
+        """Write request and read one length-prefixed response by deadline.
+
+        Returns the response, or a short result if the worker closed its
+        output first.
+
+        Raises:
+            _subprocess.TimeoutExpired: If the deadline passes first.
+        """
+        import selectors
+
+        in_fd = self._stdin.fileno()
+        out_fd = self._stdout.fileno()
+        view = memoryview(request)
+        chunks: List[bytes] = []
+        needed = 4
+        header = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(in_fd, selectors.EVENT_WRITE)
+            selector.register(out_fd, selectors.EVENT_READ)
+            remaining = None
+            while needed:
+                if deadline is not None:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        raise _subprocess.TimeoutExpired(self._command, 0)
+                for key, _ in selector.select(remaining):
+                    if key.fd == in_fd:
+                        try:
+                            view = view[os.write(in_fd, view) :]
+                        except BlockingIOError:
+                            continue
+                        if not view:
+                            selector.unregister(in_fd)
+                        continue
+                    chunk = os.read(out_fd, min(needed, _READ_SIZE))
+                    if not chunk:
+                        return header + b"".join(chunks)
+                    chunks.append(chunk)
+                    needed -= len(chunk)
+                    if not needed and not header:
+                        header = b"".join(chunks)
+                        chunks = []
+                        needed = int.from_bytes(header, "little")
+        return header + b"".join(chunks)
+
+    def submit(
+        self, payload: bytes, timeout: Optional[float] = None
+    ) -> ExecutionResult:
+        """Send one request to the worker and return its response.
+
+        Args:
+            payload: Request bytes sent to the worker.
+            timeout: Seconds to wait for the response, overriding the
+                pool's timeout for this request.
+
+        Returns:
+            ExecutionResult with exit_code 0 and the raw response bytes as
+            stdout_bytes.
+
+        Raises:
+            ConfigurationError: If timeout is not positive.
+            ExecutionError: If the worker does not answer within the
+                timeout (exit code -1), or exits or closes its output
+                mid-response. The worker is replaced in both cases, unless
+                the pool has been closed.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        elif timeout <= 0:
+            raise ConfigurationError(
+                "timeout must be positive",
+                config_key="timeout",
+                config_value=timeout,
+                valid_values=["positive float/int"],
+            )
+
+        request = len(payload).to_bytes(4, "little") + payload
+        with self._lock:
+            proc = self._proc
+            start_time = time.perf_counter()
+            deadline = None if timeout is None else start_time + timeout
+            timed_out = False
+            try:
+                response = self._transfer(request, deadline)
+            except _subprocess.TimeoutExpired:
+                timed_out = True
+                response = b""
+            except (BrokenPipeError, ValueError):
+                # ValueError: the pipes were already closed by close()
+                response = b""
+            execution_time = time.perf_counter() - start_time
+
+            data = response[4:]
+            size = int.from_bytes(response[:4], "little")
+            if len(response) < 4 or len(data) < size:
+                exit_code = -1 if timed_out else proc.poll()
+                if not self._closed:
+                    self._restart()
+                raise _exec_err(
+                    self.executable,
+                    -2 if exit_code is None else exit_code,
+                    self.args,
+                    None,
+                    "Pool worker did not answer within %.3fs" % execution_time
+                    if timed_out
+                    else "Pool worker exited or closed its output",
+                    execution_time,
+                )
+
+        return ExecutionResult(
+            self.executable,
+            self.args,
+            0,
+            data,
+            b"",
+            execution_time,
+            None,
+            None,
+            None,
+            True,
+        )
+
+    def close(self, timeout: Optional[float] = 5.0) -> int:
+        """Close the worker's stdin and wait for it to exit.
+
+        The worker is killed if it has not exited within `timeout` seconds.
+
+        Returns:
+            The worker's exit code.
+        """
+        with self._lock:
+            self._closed = True
+            proc = self._proc
+            if not self._stdin.closed:
+                try:
+                    self._stdin.close()
+                except BrokenPipeError:
+                    pass
+            try:
+                proc.wait(timeout=timeout)
+            except _subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            self._stdout.close()
+            return proc.returncode
+
+    def __enter__(self) -> "ExecutablePool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -8,6 +8,7 @@ Follows fail-fast design principles with minimal import overhead.
 import logging
 import logging.handlers
 import sys
+import threading
 from pathlib import Path
 from typing import Optional, Any, Union, Type
 import time
@@ -45,16 +46,17 @@ class SkogLibFormatter(logging.Formatter):
         self.simple_format = DEFAULT_FORMAT
         self.detailed_format = DETAILED_FORMAT
         super().__init__()
+        # One formatter per layout, built once; format() only picks one, so
+        # concurrent records never race on a shared format string
+        self._simple = logging.Formatter(self.simple_format)
+        self._detailed = logging.Formatter(self.detailed_format)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with appropriate detail level."""
         # Use detailed format for DEBUG level or when explicitly requested
         if self.detailed or record.levelno <= logging.DEBUG:
-            self._style._fmt = self.detailed_format
-        else:
-            self._style._fmt = self.simple_format
-
-        return super().format(record)
+            return self._detailed.format(record)
+        return self._simple.format(record)
 
 
 class PerformanceLogger:
@@ -80,9 +82,13 @@ class PerformanceLogger:
         self.threshold_ms = threshold_ms
         self.start_time: Optional[float] = None
 
-    def __enter__(self) -> "PerformanceLogger":
-        if self.logger.isEnabledFor(logging.DEBUG):
-            self.start_time = time.perf_counter()
+    # time.perf_counter and logging.DEBUG are bound as default arguments so
+    # these per-operation hooks read locals instead of module attributes
+    def __enter__(
+        self, _perf_counter: Any = time.perf_counter, _DEBUG: int = logging.DEBUG
+    ) -> "PerformanceLogger":
+        if self.logger.isEnabledFor(_DEBUG):
+            self.start_time = _perf_counter()
         return self
 
     def __exit__(
@@ -90,13 +96,31 @@ class PerformanceLogger:
         exc_type: Optional[Type[BaseException]],
         exc_val: Optional[BaseException],
         exc_tb: Optional[Any],
+        _perf_counter: Any = time.perf_counter,
     ) -> None:
         if self.start_time is not None:
-            duration_ms = (time.perf_counter() - self.start_time) * 1000
+            duration_ms = (_perf_counter() - self.start_time) * 1000
             if duration_ms >= self.threshold_ms:
                 self.logger.debug(f"{self.operation} completed in {duration_ms:.2f}ms")
 
 
+class _NullPerf(PerformanceLogger):
+    """Do-nothing PerformanceLogger used when DEBUG is disabled.
+
+    A single shared instance is handed out for every operation, so its
+    operation attribute is empty.
+    """
+
+    def __enter__(self, *args: Any) -> "_NullPerf":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_PERF = _NullPerf(logging.getLogger(f"{LOGGER_PREFIX}.performance"), "")
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the skoglib prefix.
@@ -143,7 +167,11 @@ def configure_logging(
     
     # Get the base skoglib logger (parent of all skoglib loggers)
     root_logger = logging.getLogger(LOGGER_PREFIX)
-    
+
+    # Explicit configuration replaces the deferred default setup
+    if _lazy_handler is not None and _lazy_handler in root_logger.handlers:
+        root_logger.removeHandler(_lazy_handler)
+
     # Only configure once unless forced
     if root_logger.handlers and not force:
         return
@@ -220,24 +248,72 @@ def get_performance_logger(name: str) -> PerformanceLogger:
         name: Name of the operation being timed
 
     Returns:
-        PerformanceLogger context manager
+        PerformanceLogger context manager, or a shared no-op PerformanceLogger
+        if the performance logger is not enabled for DEBUG
     """
     logger = get_logger("performance")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return _NULL_PERF
     return PerformanceLogger(logger, name)
 
 
-# Initialize default logging configuration with minimal overhead
-# Only configure if not already done and not in testing environment
+class _ConfigureOnFirstUse(logging.Handler):
+    """
+    Placeholder handler that applies configure_from_env() on the first record.
+
+    It is installed at import time, so formatters and real handlers are only
+    created once skoglib actually logs something.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        root_logger = logging.getLogger(LOGGER_PREFIX)
+        # Records logged concurrently may all reach the placeholder; only the
+        # first one to take the lock configures, the others see it removed
+        with _configure_lock:
+            if self in root_logger.handlers:
+                # Rebind rather than mutate: the logger is iterating the old list
+                root_logger.handlers = [
+                    h for h in root_logger.handlers if h is not self
+                ]
+                try:
+                    configure_from_env()
+                except Exception:
+                    # Fail silently on configuration errors to maintain library
+                    # reliability; users can explicitly configure logging if needed
+                    return False
+
+        # Deliver the record that triggered configuration
+        for handler in root_logger.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        pass
+
+
+_lazy_handler: Optional[logging.Handler] = None
+
+# Serializes the placeholder's one-shot configure step
+_configure_lock = threading.Lock()
+
+# Defer default logging configuration until the first record is emitted.
+# Only install if not already configured and not in testing environment.
 if (
     not os.getenv("PYTEST_CURRENT_TEST")
     and not logging.getLogger(LOGGER_PREFIX).handlers
 ):
-    try:
-        configure_from_env()
-    except Exception:
-        # Fail silently on configuration errors to maintain library reliability
-        # Users can explicitly configure logging if needed
-        pass
+    _lazy_handler = _ConfigureOnFirstUse()
+    _root_logger = logging.getLogger(LOGGER_PREFIX)
+    _root_logger.addHandler(_lazy_handler)
+    # The level is applied now so records below it are never created
+    _root_logger.setLevel(
+        getattr(
+            logging,
+            os.getenv("SKOGLIB_LOG_LEVEL", "WARNING").upper(),
+            DEFAULT_LOG_LEVEL,
+        )
+    )
 
 # Track import time for performance monitoring
 _import_duration = (time.perf_counter() - _import_start) * 1000
@@ -8,6 +8,7 @@ by the configuration management.
 
 import time
 import functools
+import logging
 from typing import Any, Callable, Tuple, TypeVar, Dict, Optional
 from pathlib import Path
 
@@ -41,13 +42,14 @@ def time_execution(func: Callable[[], Any]) -> Tuple[Any, float]:
         end_time = time.perf_counter()
         duration = end_time - start_time
 
-        logger.debug(
-            "Function execution completed",
-            extra={
-                "function": getattr(func, "__name__", str(func)),
-                "duration_seconds": duration,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Function execution completed",
+                extra={
+                    "function": getattr(func, "__name__", str(func)),
+                    "duration_seconds": duration,
+                },
+            )
 
         return result, duration
 
@@ -149,16 +151,17 @@ def timing_decorator(func: F) -> F:
             end_time = time.perf_counter()
             duration = end_time - start_time
 
-            logger.debug(
-                f"Function '{func.__name__}' completed",
-                extra={
-                    "function": func.__name__,
-                    "duration_seconds": duration,
-                    "formatted_duration": format_duration(duration),
-                    "args_count": len(args),
-                    "kwargs_count": len(kwargs),
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Function '{func.__name__}' completed",
+                    extra={
+                        "function": func.__name__,
+                        "duration_seconds": duration,
+                        "formatted_duration": format_duration(duration),
+                        "args_count": len(args),
+                        "kwargs_count": len(kwargs),
+                    },
+                )
 
             return result
 
@@ -5,6 +5,7 @@ Tests configuration management, environment variable loading, executable discove
 path resolution, thread safety, and validation.
 """
 
+import dataclasses
 import os
 import tempfile
 import threading
@@ -20,6 +21,7 @@ from skoglib.config import (
     reset_config,
     load_config_from_env,
     find_executable,
+    find_executables,
     validate_executable,
     resolve_path,
     merge_configs,
@@ -37,7 +39,7 @@ class TestSkogAIConfig(TestCase):
         # Check default values
         self.assertEqual(config.default_timeout, 30)
         self.assertEqual(config.log_level, "INFO")
-        self.assertEqual(config.executable_search_paths, [])
+        self.assertEqual(config.executable_search_paths, ())
         self.assertEqual(config.env_prefix, "SKOGAI")
 
     def test_custom_initialization(self):
@@ -51,9 +53,33 @@ class TestSkogAIConfig(TestCase):
 
         self.assertEqual(config.default_timeout, 60)
         self.assertEqual(config.log_level, "DEBUG")
-        self.assertEqual(config.executable_search_paths, ["/usr/local/bin", "/opt/bin"])
+        self.assertEqual(config.executable_search_paths, ("/usr/local/bin", "/opt/bin"))
         self.assertEqual(config.env_prefix, "CUSTOM")
 
+    def test_initialization_normalizes_values(self):
+        """Test that log level and search paths are normalized on creation."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = SkogAIConfig(
+                log_level="debug", executable_search_paths=[Path(temp_dir)]
+            )
+
+            self.assertEqual(config.log_level, "DEBUG")
+            self.assertEqual(config.executable_search_paths, (temp_dir,))
+
+    def test_config_is_frozen_and_hashable(self):
+        """Test that configuration instances are immutable and hashable."""
+        config = SkogAIConfig(executable_search_paths=["/usr/local/bin"])
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.default_timeout = 60
+
+        updated = dataclasses.replace(config, default_timeout=60)
+        self.assertEqual(updated.default_timeout, 60)
+        self.assertEqual(config.default_timeout, 30)
+
+        same_config = SkogAIConfig(executable_search_paths=["/usr/local/bin"])
+        self.assertEqual(hash(config), hash(same_config))
+
     def test_validation_invalid_timeout(self):
         """Test validation with invalid timeout values."""
         with self.assertRaises(ConfigurationError) as cm:
@@ -102,7 +128,7 @@ class TestSkogAIConfig(TestCase):
 
             # Should not raise an exception, just log a warning
             config = SkogAIConfig(executable_search_paths=[nonexistent_path])
-            self.assertEqual(config.executable_search_paths, [nonexistent_path])
+            self.assertEqual(config.executable_search_paths, (nonexistent_path,))
 
     def test_validation_file_as_search_path(self):
         """Test that files (not directories) as search paths cause validation error."""
@@ -158,7 +184,7 @@ class TestEnvironmentVariableLoading(TestCase):
 
         self.assertEqual(config.default_timeout, 30)
         self.assertEqual(config.log_level, "INFO")
-        self.assertEqual(config.executable_search_paths, [])
+        self.assertEqual(config.executable_search_paths, ())
 
     def test_load_config_timeout(self):
         """Test loading timeout from environment."""
@@ -179,7 +205,7 @@ class TestEnvironmentVariableLoading(TestCase):
         os.environ["SKOGAI_SEARCH_PATHS"] = "/usr/local/bin:/opt/bin:/custom/bin"
         config = load_config_from_env()
 
-        expected_paths = ["/usr/local/bin", "/opt/bin", "/custom/bin"]
+        expected_paths = ("/usr/local/bin", "/opt/bin", "/custom/bin")
         self.assertEqual(config.executable_search_paths, expected_paths)
 
     def test_load_config_search_paths_empty_entries(self):
@@ -188,7 +214,7 @@ class TestEnvironmentVariableLoading(TestCase):
         config = load_config_from_env()
 
         # Empty entries should be filtered out
-        expected_paths = ["/usr/local/bin", "/opt/bin"]
+        expected_paths = ("/usr/local/bin", "/opt/bin")
         self.assertEqual(config.executable_search_paths, expected_paths)
 
     def test_load_config_all_variables(self):
@@ -206,7 +232,7 @@ class TestEnvironmentVariableLoading(TestCase):
         self.assertEqual(config.default_timeout, 120)
         self.assertEqual(config.log_level, "ERROR")
         self.assertEqual(
-            config.executable_search_paths, ["/custom/bin", "/another/path"]
+            config.executable_search_paths, ("/custom/bin", "/another/path")
         )
 
     def test_load_config_invalid_timeout(self):
@@ -388,6 +414,23 @@ class TestExecutableDiscovery(TestCase):
 
             self.assertEqual(result, str(executable_path))
 
+    def test_find_executable_relative_name_uses_search_paths(self):
+        """Test that a name like "bin/tool" is joined onto each search path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            executable_path = Path(temp_dir) / "bin" / "test_exec"
+            executable_path.parent.mkdir()
+            executable_path.write_text("#!/bin/bash\\necho test")
+            executable_path.chmod(0o755)
+
+            result = find_executable(
+                os.path.join("bin", "test_exec"), search_paths=[temp_dir]
+            )
+
+            self.assertEqual(result, str(executable_path))
+            self.assertIsNone(
+                find_executable(os.path.join("nope", "test_exec"), [temp_dir])
+            )
+
     def test_find_executable_not_found(self):
         """Test finding non-existent executable."""
         result = find_executable("definitely_does_not_exist_12345")
@@ -403,6 +446,59 @@ class TestExecutableDiscovery(TestCase):
         self.assertIsNone(result1)
         self.assertIsNone(result2)
 
+    def test_find_executable_caches_lookups(self):
+        """Test that cached lookups are re-validated and misses are not cached."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            executable_path = Path(temp_dir) / "cached_exec"
+
+            # A miss is not remembered, so a later install is found
+            self.assertIsNone(
+                find_executable("cached_exec", search_paths=[temp_dir])
+            )
+            executable_path.write_text("#!/bin/bash\necho test")
+            executable_path.chmod(0o755)
+            result1 = find_executable("cached_exec", search_paths=[temp_dir])
+            self.assertEqual(result1, str(executable_path))
+
+            result2 = find_executable("cached_exec", search_paths=[temp_dir])
+            self.assertEqual(result1, result2)
+
+            # Removing the file invalidates the cached result
+            executable_path.unlink()
+            self.assertIsNone(
+                find_executable("cached_exec", search_paths=[temp_dir])
+            )
+
+    def test_find_executables_bulk_lookup(self):
+        """Test resolving several executables in one pass."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("tool_a", "tool_b"):
+                tool_path = Path(temp_dir) / name
+                tool_path.write_text("#!/bin/bash\necho test")
+                tool_path.chmod(0o755)
+
+            plain_file = Path(temp_dir) / "not_a_tool"
+            plain_file.write_text("data")
+            plain_file.chmod(0o644)
+
+            results = find_executables(
+                ["tool_a", "tool_b", "not_a_tool", "definitely_missing_12345"],
+                search_paths=[temp_dir],
+            )
+
+            self.assertEqual(results["tool_a"], os.path.join(temp_dir, "tool_a"))
+            self.assertEqual(results["tool_b"], os.path.join(temp_dir, "tool_b"))
+            self.assertIsNone(results["not_a_tool"])
+            self.assertIsNone(results["definitely_missing_12345"])
+
+    def test_find_executables_matches_find_executable(self):
+        """Test that bulk lookup agrees with single lookups for PATH tools."""
+        names = ["ls", "sh", "definitely_missing_12345"]
+        results = find_executables(names)
+
+        for name in names:
+            self.assertEqual(results[name], find_executable(name))
+
     def test_validate_executable_valid(self):
         """Test validating a valid executable."""
         # Test with a known executable
@@ -545,7 +641,7 @@ class TestIntegration(TestCase):
         # Verify environment values were loaded
         self.assertEqual(config.default_timeout, 120)
         self.assertEqual(config.log_level, "DEBUG")
-        self.assertEqual(config.executable_search_paths, ["/usr/local/bin", "/opt/bin"])
+        self.assertEqual(config.executable_search_paths, ("/usr/local/bin", "/opt/bin"))
 
         # Test that subsequent calls return same instance
         config2 = get_config()
@@ -560,7 +656,7 @@ class TestIntegration(TestCase):
             executable_path.chmod(0o755)
 
             # Find executable using config search paths + temp dir
-            search_paths = config.executable_search_paths + [temp_dir]
+            search_paths = config.executable_search_paths + (temp_dir,)
             result = find_executable("mock_tool", search_paths=search_paths)
 
             if result:  # Only test if found
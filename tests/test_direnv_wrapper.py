@@ -0,0 +1,46 @@
+"""
+Test suite for the scripts/direnv_wrapper.py helper script.
+
+The script is not part of the package, so it is loaded from its file path.
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest import TestCase
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "direnv_wrapper.py"
+
+_spec = importlib.util.spec_from_file_location("direnv_wrapper", SCRIPT)
+direnv_wrapper = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(direnv_wrapper)
+
+
+class TestRunCommand(TestCase):
+    """Test the run_command() helper."""
+
+    def test_captures_output(self):
+        """Test that stdout and the return code are returned."""
+        stdout, stderr, returncode = direnv_wrapper.run_command(["echo", "hi"])
+
+        self.assertEqual(stdout, "hi\n")
+        self.assertEqual(stderr, "")
+        self.assertEqual(returncode, 0)
+
+    def test_missing_binary(self):
+        """Test that a missing program returns 127 instead of raising."""
+        stdout, stderr, returncode = direnv_wrapper.run_command(
+            ["definitely-not-a-real-command-12345"]
+        )
+
+        self.assertEqual(stdout, "")
+        self.assertIn("definitely-not-a-real-command-12345", stderr)
+        self.assertEqual(returncode, 127)
+
+    def test_missing_binary_expect_large(self):
+        """Test that the tempfile path reports a missing program the same way."""
+        _, stderr, returncode = direnv_wrapper.run_command(
+            "definitely-not-a-real-command-12345", expect_large=True
+        )
+
+        self.assertIn("definitely-not-a-real-command-12345", stderr)
+        self.assertEqual(returncode, 127)
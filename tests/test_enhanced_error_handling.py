@@ -5,6 +5,8 @@ This test file validates the new exception hierarchy, error messages with sugges
 serialization capabilities, and timestamp functionality.
 """
 
+import copy
+import pickle
 import time
 import unittest
 
@@ -38,6 +40,15 @@ class TestEnhancedErrorHandling(unittest.TestCase):
         # Verify timestamp is recent
         self.assertGreater(error_dict["timestamp"], time.time() - 1.0)
 
+    def test_timestamp_is_sampled_once(self):
+        """Test that the timestamp is fixed once it has been read."""
+        error = SkogAIError("Test error", log_error=False)
+
+        first = error.timestamp
+        time.sleep(0.01)
+        self.assertEqual(error.timestamp, first)
+        self.assertEqual(error.to_dict()["timestamp"], first)
+
     def test_timeout_error_hierarchy_and_details(self):
         """Test TimeoutError is properly structured with actionable suggestions."""
         executable = "long-running-command"
@@ -66,7 +77,7 @@ class TestEnhancedErrorHandling(unittest.TestCase):
         error_dict = error.to_dict()
         self.assertIn("suggestions", error_dict["details"])
         suggestions = error_dict["details"]["suggestions"]
-        self.assertIsInstance(suggestions, list)
+        self.assertIsInstance(suggestions, tuple)
         self.assertTrue(any("timeout" in s.lower() for s in suggestions))
         self.assertTrue(any("hanging" in s.lower() for s in suggestions))
 
@@ -101,6 +112,7 @@ class TestEnhancedErrorHandling(unittest.TestCase):
         # Test attributes
         self.assertEqual(error.executable, executable)
         self.assertEqual(error.file_mode, file_mode)
+        self.assertEqual(error.search_paths, [])
 
     def test_executable_not_found_enhanced_suggestions(self):
         """Test ExecutableNotFoundError includes actionable suggestions."""
@@ -121,6 +133,72 @@ class TestEnhancedErrorHandling(unittest.TestCase):
         self.assertTrue(any("path" in s.lower() for s in suggestions))
         self.assertTrue(any("absolute" in s.lower() for s in suggestions))
 
+    def test_suggestions_shared_and_kept_out_of_details(self):
+        """Test suggestions come from the class and are not stored per instance."""
+        first = ExecutableNotFoundError("tool-a", log_error=False)
+        second = ExecutableNotFoundError("tool-b", log_error=False)
+
+        self.assertNotIn("suggestions", first.details)
+        self.assertIs(first.suggestions, second.suggestions)
+        self.assertIs(first.to_dict()["details"]["suggestions"], first.suggestions)
+
+    def test_executable_not_found_pool_reuses_released_instances(self):
+        """Test that get() reuses an instance handed back with release()."""
+        first = ExecutableNotFoundError.get("tool-a")
+        try:
+            raise first
+        except ExecutableNotFoundError as e:
+            e.release()
+
+        second = ExecutableNotFoundError.get("tool-b", ["/opt/bin"])
+        self.assertIs(second, first)
+        self.assertIsNone(second.__traceback__)
+        self.assertEqual(second.executable, "tool-b")
+        self.assertEqual(second.search_paths, ["/opt/bin"])
+        self.assertEqual(second.args, (second.message,))
+        self.assertIn("tool-b", str(second))
+        self.assertNotIn("tool-a", str(second))
+
+        # The pool is empty again, so the next get() allocates
+        self.assertIsNot(ExecutableNotFoundError.get("tool-c"), second)
+
+    def test_setters_refresh_cached_string(self):
+        """Test that assigning message or details invalidates str()."""
+        error = SkogAIError("original", log_error=False)
+        self.assertEqual(str(error), "original")
+
+        error.message = "updated"
+        self.assertEqual(str(error), "updated")
+
+        error.details = {"key": "value"}
+        self.assertIn("key=value", str(error))
+
+    def test_errors_survive_pickle_and_copy(self):
+        """Test that message, details and attributes survive pickling."""
+        errors = [
+            SkogAIError("base failure", {"operation": "test"}, log_error=False),
+            SkogAIError("no details", log_error=False),
+            ExecutableNotFoundError("tool", ["/usr/bin", "/bin"], log_error=False),
+            PermissionError("/usr/bin/tool", "644", log_error=False),
+            ExecutionError("cmd", 2, ["-x"], "out", "err", 0.5, log_error=False),
+            TimeoutError("sleep", 1.0, ["10"], "partial", None, log_error=False),
+            ConfigurationError("bad timeout", "timeout", -1, log_error=False),
+        ]
+
+        for error in errors:
+            for clone in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+                with self.subTest(error=type(error).__name__):
+                    self.assertIs(type(clone), type(error))
+                    self.assertEqual(clone.args, (error.message,))
+                    self.assertEqual(clone.message, error.message)
+                    self.assertEqual(clone.details, error.details)
+                    self.assertEqual(str(clone), str(error))
+
+        timeout = pickle.loads(pickle.dumps(errors[5]))
+        self.assertEqual(timeout.timeout, 1.0)
+        self.assertEqual(timeout.partial_stdout, "partial")
+        self.assertEqual(timeout.exit_code, -1)
+
     def test_execution_error_enhanced_suggestions(self):
         """Test ExecutionError provides debugging guidance."""
         executable = "failing-command"
@@ -223,6 +301,14 @@ class TestEnhancedErrorHandling(unittest.TestCase):
         error_dict = error.to_dict()
         self.assertEqual(error_dict["details"], context)
 
+    def test_context_is_deprecated(self):
+        """Test that the context argument and attribute emit DeprecationWarning."""
+        with self.assertWarns(DeprecationWarning):
+            error = SkogAIError("test", context={"a": 1}, log_error=False)
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertIs(error.context, error.details)
+
     def test_cannot_specify_both_details_and_context(self):
         """Test that specifying both details and context raises an error."""
         with self.assertRaises(ValueError) as context:
@@ -230,6 +316,38 @@ class TestEnhancedErrorHandling(unittest.TestCase):
 
         self.assertIn("Cannot specify both", str(context.exception))
 
+    def test_errors_without_details_build_empty_dict_lazily(self):
+        """Test that errors without details get their own dict on first access."""
+        first = SkogAIError("first", log_error=False)
+        second = SkogAIError("second", log_error=False)
+
+        # str() does not need the details dict
+        self.assertEqual(str(first), "first")
+        self.assertIsNone(first._details)
+
+        self.assertEqual(first.details, {})
+        self.assertIs(first.details, first.details)
+        self.assertIsNot(first.details, second.details)
+        first.details["key"] = "value"
+        self.assertEqual(second.details, {})
+        self.assertIsInstance(second.to_dict()["details"], dict)
+
+    def test_exception_attributes_use_slots(self):
+        """Test that exception attributes are stored in slots, not __dict__."""
+        errors = [
+            SkogAIError("base", details={"key": "value"}, log_error=False),
+            ExecutableNotFoundError("missing", ["/bin"], log_error=False),
+            ExecutionError("cmd", 1, ["--flag"], "out", "err", 0.1, log_error=False),
+            TimeoutError("slow-cmd", 5.0, command_args=["--wait"], log_error=False),
+            PermissionError("/bin/locked", file_mode="0o644", log_error=False),
+            ConfigurationError("bad", config_key="k", log_error=False),
+        ]
+
+        for error in errors:
+            with self.subTest(error_type=type(error).__name__):
+                str(error)
+                error.to_dict()
+                self.assertEqual(error.__dict__, {})
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,8 @@ from skoglib.exceptions import (
     ExecutableNotFoundError,
     ExecutionError,
     ConfigurationError,
+    TimeoutError,
+    batched_errors,
 )
 from skoglib.logging_config import get_logger, configure_logging
 
@@ -75,6 +77,15 @@ class TestExceptionLogging(TestCase):
         self.assertIn("value", logged_message)
         self.assertIn("42", logged_message)
 
+    def test_skogai_error_defers_context_formatting(self):
+        """Test that details are passed as log arguments, not pre-formatted."""
+        details = {"key": "value"}
+        SkogAIError("Deferred error", details=details)
+
+        record = self.mock_handler.handle.call_args[0][0]
+        self.assertEqual(record.msg, "%s - Context: %s")
+        self.assertIs(record.args[1], details)
+
     def test_skogai_error_can_disable_logging(self):
         """Test that logging can be disabled for SkogAIError."""
         message = "Test error without logging"
@@ -87,6 +98,18 @@ class TestExceptionLogging(TestCase):
         # Should not have logged anything
         self.mock_handler.handle.assert_not_called()
 
+    def test_unlogged_error_can_be_logged_at_raise_site(self):
+        """Test that _log() logs an error constructed with log_error=False."""
+        error = ExecutableNotFoundError("probe-tool", log_error=False)
+        self.mock_handler.handle.assert_not_called()
+
+        error._log()
+
+        self.mock_handler.handle.assert_called_once()
+        call_args = self.mock_handler.handle.call_args[0][0]
+        self.assertEqual(call_args.levelno, logging.ERROR)
+        self.assertIn("probe-tool", call_args.getMessage())
+
     def test_executable_not_found_error_logs(self):
         """Test that ExecutableNotFoundError logs appropriately."""
         executable = "nonexistent-command"
@@ -134,6 +157,24 @@ class TestExceptionLogging(TestCase):
         self.assertIn(str(exit_code), logged_message)
         self.assertIn("failed", logged_message)
 
+    def test_timeout_error_logs_timeout_message(self):
+        """Test that TimeoutError logs its own message, not the generic one."""
+        TimeoutError("slow-command", 5.0, command_args=["--wait"])
+
+        call_args = self.mock_handler.handle.call_args[0][0]
+        logged_message = call_args.getMessage()
+        self.assertIn("slow-command --wait", logged_message)
+        self.assertIn("timed out after 5.0 seconds", logged_message)
+        self.assertNotIn("failed with exit code", logged_message)
+
+    def test_execution_error_message_args_and_repr(self):
+        """Test that the lazily built message backs args and repr."""
+        error = ExecutionError("cmd", 2, ["-x"], log_error=False)
+
+        self.assertEqual(error.message, "Command 'cmd -x' failed with exit code 2")
+        self.assertEqual(error.args, (error.message,))
+        self.assertEqual(repr(error), f"ExecutionError({error.message!r})")
+
     def test_configuration_error_logs(self):
         """Test that ConfigurationError logs configuration details."""
         message = "Invalid configuration"
@@ -158,6 +199,34 @@ class TestExceptionLogging(TestCase):
         logged_message = call_args.getMessage()
         self.assertIn(message, logged_message)
 
+    def test_batched_errors_log_single_record(self):
+        """Test that errors created inside batched_errors() are logged once."""
+        with batched_errors() as errors:
+            for i in range(3):
+                try:
+                    raise ConfigurationError(f"Invalid entry {i}")
+                except ConfigurationError:
+                    pass
+
+            # Nothing is logged until the block exits
+            self.mock_handler.handle.assert_not_called()
+
+        self.assertEqual(len(errors), 3)
+        self.mock_handler.handle.assert_called_once()
+        record = self.mock_handler.handle.call_args[0][0]
+        self.assertEqual(record.levelno, logging.ERROR)
+        logged_message = record.getMessage()
+        self.assertIn("Batched 3 errors", logged_message)
+        self.assertIn("Invalid entry 2", logged_message)
+
+    def test_batched_errors_ignores_unlogged_errors(self):
+        """Test that log_error=False errors are not collected by a batch."""
+        with batched_errors() as errors:
+            SkogAIError("quiet", log_error=False)
+
+        self.assertEqual(errors, [])
+        self.mock_handler.handle.assert_not_called()
+
     def test_exception_string_representation(self):
         """Test that exception string representation includes context."""
         message = "Test error"
@@ -171,6 +240,31 @@ class TestExceptionLogging(TestCase):
         self.assertIn("executable=test-cmd", error_str)
         self.assertIn("exit_code=1", error_str)
 
+    def test_execution_error_keeps_output_out_of_context(self):
+        """Test that captured output is stored on attributes, not in context."""
+        error = ExecutionError(
+            "noisy-cmd", 1, stdout="x" * 10000, stderr="boom", log_error=False
+        )
+
+        self.assertEqual(error.stdout, "x" * 10000)
+        self.assertEqual(error.stderr, "boom")
+        self.assertNotIn("stdout", error.details)
+        self.assertNotIn("stderr", error.details)
+
+    def test_exception_string_truncates_long_values(self):
+        """Test that long context values are truncated in the string form."""
+        error = SkogAIError("Test error", details={"blob": "y" * 10000}, log_error=False)
+        error_str = str(error)
+
+        self.assertIn("(truncated)", error_str)
+        self.assertLess(len(error_str), 1000)
+
+    def test_exception_string_is_cached(self):
+        """Test that the string representation is built once and reused."""
+        error = SkogAIError("Test error", details={"key": "value"}, log_error=False)
+
+        self.assertIs(str(error), str(error))
+
     def test_exception_without_context_simple_string(self):
         """Test that exceptions without context have simple string representation."""
         message = "Simple error"
@@ -224,6 +318,27 @@ class TestExceptionLogging(TestCase):
 class TestLoggingPerformance(TestCase):
     """Test that logging doesn't significantly impact performance."""
 
+    def tearDown(self):
+        """Restore the default test logging level."""
+        configure_logging(level="WARNING", force=True)
+
+    def test_details_not_formatted_when_error_logging_disabled(self):
+        """Test that details are never stringified if ERROR is filtered out."""
+        configure_logging(level=logging.CRITICAL, force=True)
+
+        class CountingValue:
+            calls = 0
+
+            def __str__(self):
+                CountingValue.calls += 1
+                return "value"
+
+            __repr__ = __str__
+
+        SkogAIError("Filtered error", details={"value": CountingValue()})
+
+        self.assertEqual(CountingValue.calls, 0)
+
     def test_exception_creation_performance(self):
         """Test that exception creation with logging is reasonably fast."""
         import time
@@ -5,13 +5,26 @@ Tests core executable runner functionality including successful execution,
 error scenarios, timeout handling, and edge cases.
 """
 
+import asyncio
+import errno
 import os
 import tempfile
 import time
 from unittest import TestCase
 from unittest.mock import patch
 
-from skoglib.executable import run_executable, ExecutionResult, _find_executable
+from skoglib.executable import (
+    run_executable,
+    run_executable_async,
+    run_many,
+    run_executable_quick,
+    ExecutionResult,
+    ExecutablePool,
+    _find_executable,
+    _which_cache,
+    _pipesize_from_env,
+    _spawn,
+)
 from skoglib.exceptions import (
     ExecutableNotFoundError,
     ExecutionError,
@@ -72,6 +85,21 @@ class TestExecutionResult(TestCase):
         result = ExecutionResult("pwd", [], 0, "", "", 0.1)
         self.assertEqual(result.command_line, "pwd")
 
+    def test_execution_result_uses_slots(self):
+        """Test that results store their fields in slots, not a __dict__."""
+        result = ExecutionResult("echo", [], 0, "", "", 0.1)
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result, ExecutionResult("echo", [], 0, "", "", 0.1))
+
+    def test_output_bytes_decoded_on_access(self):
+        """Test that raw output is decoded (with newline translation) lazily."""
+        result = ExecutionResult("echo", [], 0, b"line1\r\nline2\n", b"", 0.1)
+
+        self.assertEqual(result.stdout, "line1\nline2\n")
+        self.assertEqual(result.stderr, "")
+        self.assertIs(result.stdout, result.stdout)
+
 
 class TestFindExecutable(TestCase):
     """Test the _find_executable function."""
@@ -101,6 +129,61 @@ class TestFindExecutable(TestCase):
         self.assertTrue(found_path.endswith("/echo") or found_path.endswith("echo"))
         self.assertTrue(os.path.exists(found_path))
 
+    def test_path_lookup_is_cached(self):
+        """Test that repeated PATH lookups are served from the cache."""
+        first = _find_executable("echo")
+        second = _find_executable("echo")
+
+        self.assertEqual(first, second)
+        key = ("echo", os.environ.get("PATH"), os.environ.get("PATHEXT"))
+        self.assertEqual(_which_cache[key], first)
+
+    def test_path_lookup_cache_rechecks_entries(self):
+        """Test that misses are not cached and stale hits are dropped."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tool = os.path.join(tmp_dir, "skoglib_recheck_probe")
+            with patch.dict(os.environ, {"PATH": tmp_dir}):
+                with self.assertRaises(ExecutableNotFoundError):
+                    _find_executable("skoglib_recheck_probe")
+
+                with open(tool, "w") as f:
+                    f.write("#!/bin/sh\n")
+                os.chmod(tool, 0o755)
+                self.assertEqual(_find_executable("skoglib_recheck_probe"), tool)
+
+                os.unlink(tool)
+                with self.assertRaises(ExecutableNotFoundError):
+                    _find_executable("skoglib_recheck_probe")
+
+    def test_path_lookup_cache_follows_path_changes(self):
+        """Test that a changed PATH triggers a fresh lookup."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tool = os.path.join(tmp_dir, "skoglib_cache_probe")
+            with open(tool, "w") as f:
+                f.write("#!/bin/sh\n")
+            os.chmod(tool, 0o755)
+
+            with self.assertRaises(ExecutableNotFoundError):
+                _find_executable("skoglib_cache_probe")
+
+            with patch.dict(os.environ, {"PATH": tmp_dir}):
+                self.assertEqual(_find_executable("skoglib_cache_probe"), tool)
+
+    def test_absolute_path_is_rechecked_each_call(self):
+        """Test that an absolute path is validated again on every lookup."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tool = os.path.join(tmp_dir, "tool")
+            with open(tool, "w") as f:
+                f.write("#!/bin/sh\n")
+            os.chmod(tool, 0o755)
+
+            self.assertEqual(_find_executable(tool), tool)
+            self.assertEqual(_find_executable(tool), tool)
+
+            os.unlink(tool)
+            with self.assertRaises(ExecutableNotFoundError):
+                _find_executable(tool)
+
     def test_executable_not_found_absolute_path(self):
         """Test exception when absolute path doesn't exist."""
         with self.assertRaises(ExecutableNotFoundError) as cm:
@@ -242,6 +325,85 @@ class TestRunExecutable(TestCase):
         self.assertEqual(result.stdout, "")
         self.assertEqual(result.stderr, "")
 
+    def test_capture_output_disabled_timeout(self):
+        """Test that timeouts are reported when output is not captured."""
+        with self.assertRaises(ExecutionError) as cm:
+            run_executable("sleep", ["2"], timeout=0.2, capture_output=False)
+
+        self.assertEqual(cm.exception.exit_code, -1)
+        self.assertLess(cm.exception.execution_time, 1.5)
+
+    def test_max_output_bytes_keeps_tail(self):
+        """Test that max_output_bytes bounds output to its last bytes."""
+        script = (
+            "import sys; sys.stdout.write('a' * 200000 + 'END'); "
+            "sys.stderr.write('b' * 100000 + 'ERR')"
+        )
+        result = run_executable("python3", ["-c", script], max_output_bytes=10)
+
+        self.assertEqual(result.stdout, "a" * 7 + "END")
+        self.assertEqual(result.stderr, "b" * 7 + "ERR")
+
+    def test_max_output_bytes_larger_than_output(self):
+        """Test that short output is kept whole under max_output_bytes."""
+        result = run_executable("echo", ["hello"], max_output_bytes=1024)
+
+        self.assertEqual(result.stdout, "hello\n")
+        self.assertEqual(result.stderr, "")
+
+    def test_max_output_bytes_timeout_keeps_partial_output(self):
+        """Test that a bounded run reports retained output on timeout."""
+        with self.assertRaises(ExecutionError) as cm:
+            run_executable(
+                "bash",
+                ["-c", "echo started; sleep 2"],
+                timeout=0.3,
+                max_output_bytes=1024,
+            )
+
+        self.assertEqual(cm.exception.exit_code, -1)
+        self.assertEqual(cm.exception.stdout, "started\n")
+
+    def test_invalid_max_output_bytes(self):
+        """Test that a negative max_output_bytes is rejected."""
+        with self.assertRaises(ConfigurationError):
+            run_executable("echo", max_output_bytes=-1)
+
+    def test_binary_output(self):
+        """Test that binary_output keeps the raw bytes undecoded."""
+        result = run_executable("printf", ["\\377\\r\\n"], binary_output=True)
+
+        self.assertEqual(result.stdout_bytes, b"\xff\r\n")
+        self.assertEqual(result.stderr_bytes, b"")
+        self.assertIsInstance(result.stdout, str)
+
+    def test_text_output_has_no_bytes(self):
+        """Test that stdout_bytes is None unless binary_output is set."""
+        result = run_executable("echo", ["hi"])
+
+        self.assertIsNone(result.stdout_bytes)
+        self.assertIsNone(result.stderr_bytes)
+
+    def test_binary_output_error_is_text(self):
+        """Test that ExecutionError output is text even for binary runs."""
+        with self.assertRaises(ExecutionError) as cm:
+            run_executable("bash", ["-c", "echo bad >&2; exit 1"], binary_output=True)
+
+        self.assertEqual(cm.exception.stderr, "bad\n")
+
+    def test_output_encoding(self):
+        """Test that encoding selects the codec used to decode output."""
+        result = run_executable("printf", ["\\351"], encoding="latin-1")
+
+        self.assertEqual(result.stdout, "\xe9")
+
+    def test_unknown_encoding(self):
+        """Test that an unknown encoding is rejected before the run."""
+        with self.assertRaises(ConfigurationError) as cm:
+            run_executable("echo", ["hi"], encoding="no-such-codec")
+
+        self.assertEqual(cm.exception.config_key, "encoding")
+
     def test_stderr_capture(self):
         """Test capturing stderr output."""
         result = run_executable(
@@ -272,6 +434,15 @@ class TestRunExecutable(TestCase):
 
         self.assertIn("Working directory does not exist", str(cm.exception))
 
+    def test_removed_working_directory(self):
+        """Test that a working directory removed after use is rejected."""
+        tmp_dir = tempfile.mkdtemp()
+        run_executable("true", cwd=tmp_dir)
+        os.rmdir(tmp_dir)
+
+        with self.assertRaises(ConfigurationError):
+            run_executable("true", cwd=tmp_dir)
+
     def test_executable_not_found(self):
         """Test error handling when executable is not found."""
         with self.assertRaises(ExecutableNotFoundError) as cm:
@@ -280,6 +451,302 @@ class TestRunExecutable(TestCase):
         self.assertIn("nonexistent_command_12345", str(cm.exception))
 
 
+class TestRunExecutableAsync(TestCase):
+    """Test the asyncio variant of run_executable."""
+
+    def test_successful_execution(self):
+        """Test that the async variant returns a normal ExecutionResult."""
+        result = asyncio.run(run_executable_async("echo", ["hello"]))
+
+        self.assertIsInstance(result, ExecutionResult)
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout.strip(), "hello")
+        self.assertEqual(result.args, ["hello"])
+
+    def test_commands_run_concurrently(self):
+        """Test that gathered commands overlap instead of running in turn."""
+
+        async def main():
+            return await asyncio.gather(
+                *(run_executable_async("sleep", ["0.3"]) for _ in range(3))
+            )
+
+        start_time = time.perf_counter()
+        results = asyncio.run(main())
+        elapsed = time.perf_counter() - start_time
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertLess(elapsed, 0.8)
+
+    def test_execution_failure_with_check(self):
+        """Test that a non-zero exit code raises ExecutionError."""
+        with self.assertRaises(ExecutionError) as cm:
+            asyncio.run(run_executable_async("bash", ["-c", "echo oops >&2; exit 3"]))
+
+        self.assertEqual(cm.exception.exit_code, 3)
+        self.assertEqual(cm.exception.stderr.strip(), "oops")
+
+    def test_timeout_handling(self):
+        """Test that a timeout kills the child and reports exit code -1."""
+        with self.assertRaises(ExecutionError) as cm:
+            asyncio.run(run_executable_async("sleep", ["2"], timeout=0.2))
+
+        self.assertEqual(cm.exception.exit_code, -1)
+        self.assertLess(cm.exception.execution_time, 1.5)
+
+    def test_cancellation_reaps_child(self):
+        """Test that cancelling the call kills and reaps the child."""
+        procs = []
+        create = asyncio.create_subprocess_exec
+
+        async def record(*args, **kwargs):
+            proc = await create(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        async def main():
+            task = asyncio.ensure_future(run_executable_async("sleep", ["10"]))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start_time = time.perf_counter()
+        with patch("asyncio.create_subprocess_exec", side_effect=record):
+            asyncio.run(main())
+
+        self.assertLess(time.perf_counter() - start_time, 2.0)
+        self.assertEqual(len(procs), 1)
+        self.assertIsNotNone(procs[0].returncode)
+
+    def test_timeout_keeps_partial_output(self):
+        """Test that output written before a timeout is attached to the error."""
+        with self.assertRaises(ExecutionError) as cm:
+            asyncio.run(
+                run_executable_async(
+                    "bash", ["-c", "echo started; sleep 2"], timeout=0.5
+                )
+            )
+
+        self.assertEqual(cm.exception.exit_code, -1)
+        self.assertEqual(cm.exception.stdout, "started\n")
+
+    def test_max_output_bytes_keeps_tail(self):
+        """Test that max_output_bytes keeps only the end of the output."""
+        result = asyncio.run(
+            run_executable_async(
+                "bash",
+                ["-c", "head -c 200000 /dev/zero; echo tail"],
+                max_output_bytes=5,
+            )
+        )
+
+        self.assertEqual(result.stdout, "tail\n")
+
+    def test_invalid_arguments_type(self):
+        """Test that validation is shared with run_executable."""
+        with self.assertRaises(ConfigurationError):
+            asyncio.run(run_executable_async("echo", "not-a-list"))
+
+
+class TestRunExecutableQuick(TestCase):
+    """Test the unvalidated fast path."""
+
+    def test_returns_exit_code_and_output(self):
+        """Test that the quick path returns a plain (code, out, err) tuple."""
+        bash = _find_executable("bash")
+        code, out, err = run_executable_quick(bash, ("-c", "echo hi; echo no >&2"))
+
+        self.assertEqual((code, out, err), (0, "hi\n", "no\n"))
+
+    def test_failure_is_returned_not_raised(self):
+        """Test that a non-zero exit code is reported in the tuple."""
+        code, _, _ = run_executable_quick(_find_executable("false"))
+
+        self.assertEqual(code, 1)
+
+
+class TestRunMany(TestCase):
+    """Test the thread-pool batch API."""
+
+    def test_results_keep_spec_order(self):
+        """Test that results are returned in the order of their specs."""
+        results = run_many(
+            [
+                {"executable": "bash", "args": ["-c", "sleep 0.2; echo slow"]},
+                {"executable": "echo", "args": ["fast"]},
+            ]
+        )
+
+        self.assertEqual([r.stdout.strip() for r in results], ["slow", "fast"])
+
+    def test_commands_run_concurrently(self):
+        """Test that commands overlap instead of running in turn."""
+        specs = [{"executable": "sleep", "args": ["0.3"]} for _ in range(4)]
+
+        start_time = time.perf_counter()
+        results = run_many(specs, max_workers=4)
+        elapsed = time.perf_counter() - start_time
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertLess(elapsed, 0.9)
+
+    def test_failure_is_raised_after_all_commands(self):
+        """Test that the first failure is raised once every command ran."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            marker = os.path.join(tmp_dir, "ran")
+            with self.assertRaises(ExecutionError) as cm:
+                run_many(
+                    [
+                        {"executable": "bash", "args": ["-c", "exit 4"]},
+                        {"executable": "touch", "args": [marker]},
+                    ]
+                )
+
+            self.assertEqual(cm.exception.exit_code, 4)
+            self.assertTrue(os.path.exists(marker))
+
+    def test_return_exceptions(self):
+        """Test that return_exceptions puts errors in their result slot."""
+        results = run_many(
+            [
+                {"executable": "echo", "args": ["ok"]},
+                {"executable": "nonexistent-run-many-12345"},
+            ],
+            return_exceptions=True,
+        )
+
+        self.assertTrue(results[0].success)
+        self.assertIsInstance(results[1], ExecutableNotFoundError)
+
+    def test_empty_specs(self):
+        """Test that no specs give no results."""
+        self.assertEqual(run_many([]), [])
+
+
+# Echo worker for ExecutablePool: answers each request with its payload
+# upper-cased, prefixed by the worker's pid
+POOL_WORKER = """
+import os, sys
+inp, out = sys.stdin.buffer, sys.stdout.buffer
+while True:
+    header = inp.read(4)
+    if len(header) < 4:
+        break
+    data = b"%d:" % os.getpid() + inp.read(int.from_bytes(header, "little")).upper()
+    out.write(len(data).to_bytes(4, "little") + data)
+    out.flush()
+"""
+
+
+class TestExecutablePool(TestCase):
+    """Test the persistent worker pool."""
+
+    def test_submit_reuses_one_worker(self):
+        """Test that every request is served by the same worker process."""
+        with ExecutablePool("python3", ["-c", POOL_WORKER]) as pool:
+            responses = [pool.submit(b"req%d" % i).stdout_bytes for i in range(5)]
+
+        pids = {r.split(b":")[0] for r in responses}
+        self.assertEqual(len(pids), 1)
+        self.assertEqual(responses[3].split(b":")[1], b"REQ3")
+
+    def test_submit_returns_execution_result(self):
+        """Test that responses come back as binary ExecutionResults."""
+        with ExecutablePool("python3", ["-c", POOL_WORKER]) as pool:
+            result = pool.submit(b"")
+
+        self.assertIsInstance(result, ExecutionResult)
+        self.assertTrue(result.success)
+        self.assertIsInstance(result.stdout_bytes, bytes)
+        self.assertEqual(result.args, ["-c", POOL_WORKER])
+
+    def test_dead_worker_raises_execution_error(self):
+        """Test that a worker exiting without answering raises ExecutionError."""
+        pool = ExecutablePool("python3", ["-c", "import sys; sys.exit(3)"])
+        try:
+            with self.assertRaises(ExecutionError) as cm:
+                pool.submit(b"hello")
+        finally:
+            self.assertEqual(pool.close(), 3)
+
+        self.assertIn(cm.exception.exit_code, (3, -2))
+
+    def test_submit_timeout_replaces_worker(self):
+        """Test that an unanswered request times out and restarts the worker."""
+        pool = ExecutablePool("python3", ["-c", "import time; time.sleep(10)"])
+        try:
+            first_pid = pool._proc.pid
+            start_time = time.perf_counter()
+            with self.assertRaises(ExecutionError) as cm:
+                pool.submit(b"x", timeout=0.3)
+
+            self.assertLess(time.perf_counter() - start_time, 2.0)
+            self.assertEqual(cm.exception.exit_code, -1)
+            self.assertNotEqual(pool._proc.pid, first_pid)
+        finally:
+            pool.close(timeout=0.1)
+
+    def test_pool_timeout_is_default(self):
+        """Test that the pool-level timeout applies when submit() passes none."""
+        pool = ExecutablePool(
+            "python3", ["-c", "import time; time.sleep(10)"], timeout=0.3
+        )
+        try:
+            with self.assertRaises(ExecutionError) as cm:
+                pool.submit(b"x")
+        finally:
+            pool.close(timeout=0.1)
+
+        self.assertEqual(cm.exception.exit_code, -1)
+
+    def test_short_response_raises_execution_error(self):
+        """Test that a truncated response is treated as a worker failure."""
+        worker = (
+            "import sys\n"
+            "sys.stdin.buffer.read(5)\n"
+            "sys.stdout.buffer.write((10).to_bytes(4, 'little') + b'abc')\n"
+        )
+        with ExecutablePool("python3", ["-c", worker]) as pool:
+            with self.assertRaises(ExecutionError):
+                pool.submit(b"x", timeout=5)
+
+    def test_pool_recovers_after_worker_dies(self):
+        """Test that the next request is served by a replacement worker."""
+        with ExecutablePool("python3", ["-c", POOL_WORKER]) as pool:
+            first_pid = pool._proc.pid
+            pool._proc.kill()
+            pool._proc.wait()
+            with self.assertRaises(ExecutionError):
+                pool.submit(b"a", timeout=5)
+
+            result = pool.submit(b"b", timeout=5)
+
+        pid, data = result.stdout_bytes.split(b":")
+        self.assertNotEqual(int(pid), first_pid)
+        self.assertEqual(data, b"B")
+
+    def test_submit_after_close_raises(self):
+        """Test that a closed pool does not start a new worker."""
+        pool = ExecutablePool("python3", ["-c", POOL_WORKER])
+        pool.close()
+
+        with self.assertRaises(ExecutionError):
+            pool.submit(b"x")
+        self.assertIsNotNone(pool._proc.returncode)
+
+    def test_invalid_submit_timeout(self):
+        """Test that a non-positive timeout is rejected."""
+        with ExecutablePool("python3", ["-c", POOL_WORKER]) as pool:
+            with self.assertRaises(ConfigurationError):
+                pool.submit(b"x", timeout=0)
+
+    def test_missing_executable(self):
+        """Test that the worker executable is resolved up front."""
+        with self.assertRaises(ExecutableNotFoundError):
+            ExecutablePool("nonexistent-pool-worker-12345")
+
+
 class TestExecutableEdgeCases(TestCase):
     """Test edge cases and error scenarios."""
 
@@ -330,6 +797,31 @@ class TestExecutableEdgeCases(TestCase):
         self.assertEqual(exception.exit_code, -2)  # OS error indicator
         self.assertIn("Permission denied", exception.stderr)
 
+    def test_pipesize_env_is_validated(self):
+        """Test that SKOGLIB_PIPESIZE is opt-in and tolerates bad values."""
+        with patch.dict(os.environ, {"SKOGLIB_PIPESIZE": ""}):
+            self.assertEqual(_pipesize_from_env(), 0)
+        with patch.dict(os.environ, {"SKOGLIB_PIPESIZE": "lots"}):
+            self.assertEqual(_pipesize_from_env(), 0)
+        with patch.dict(os.environ, {"SKOGLIB_PIPESIZE": "1048576"}):
+            self.assertEqual(_pipesize_from_env(), 1 << 20)
+
+    def test_rejected_pipesize_falls_back_to_default(self):
+        """Test that an EPERM from the pipe size request is retried without it."""
+        calls = []
+
+        def fake_popen(*args, **kwargs):
+            calls.append(kwargs)
+            if "pipesize" in kwargs:
+                raise PermissionError(errno.EPERM, "Operation not permitted")
+            return "proc"
+
+        with patch.dict(_spawn.__globals__, {"_PIPE_KWARGS": {"pipesize": 1 << 20}}):
+            self.assertEqual(_spawn(fake_popen, ["true"]), "proc")
+            self.assertEqual(_spawn.__globals__["_PIPE_KWARGS"], {})
+
+        self.assertEqual(calls, [{"pipesize": 1 << 20}, {}])
+
     def test_none_values_handling(self):
         """Test handling of None values for optional parameters."""
         result = run_executable(
@@ -113,6 +113,26 @@ class TestImportPerformance(TestCase):
         self.assertIsNotNone(configure_from_env)
         self.assertIsNotNone(get_logger)
 
+    def test_package_import_is_lazy(self):
+        """Test that importing skoglib defers loading its submodules."""
+        import skoglib
+
+        self.assertNotIn("skoglib.executable", sys.modules)
+        self.assertNotIn("skoglib.config", sys.modules)
+
+        # Accessing a public name loads its submodule on demand
+        self.assertIsNotNone(skoglib.run_executable)
+        self.assertIn("skoglib.executable", sys.modules)
+
+    def test_subprocess_loaded_on_first_run(self):
+        """Test that executable defers importing subprocess until it runs."""
+        import skoglib.executable as executable
+
+        self.assertIsNone(executable._subprocess)
+
+        executable.run_executable("true")
+        self.assertIsNotNone(executable._subprocess)
+
 
 class TestImportTracking(TestCase):
     """Test the built-in import time tracking."""
@@ -7,10 +7,11 @@ Tests logging configuration, performance logging, formatters, and integration.
 import logging
 import os
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 from skoglib.logging_config import (
@@ -22,6 +23,7 @@ from skoglib.logging_config import (
     PerformanceLogger,
     DEFAULT_LOG_LEVEL,
     LOGGER_PREFIX,
+    _ConfigureOnFirstUse,
 )
 
 
@@ -193,6 +195,66 @@ class TestConfigureLogging(TestCase):
         root_logger.handlers.clear()
         root_logger.setLevel(logging.NOTSET)
 
+    def test_deferred_configuration_on_first_record(self):
+        """Test that the placeholder handler configures logging on first use."""
+        root_logger = get_logger("root")
+        placeholder = _ConfigureOnFirstUse()
+        root_logger.addHandler(placeholder)
+        root_logger.setLevel(logging.WARNING)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "deferred.log")
+            env = {"SKOGLIB_LOG_FILE": log_file, "SKOGLIB_LOG_CONSOLE": "false"}
+            with patch.dict(os.environ, env):
+                get_logger("deferred").warning("first record")
+
+            self.assertNotIn(placeholder, root_logger.handlers)
+            self.assertEqual(len(root_logger.handlers), 1)
+            root_logger.handlers[0].close()
+            with open(log_file) as f:
+                self.assertIn("first record", f.read())
+
+    def test_concurrent_first_records_configure_once(self):
+        """Test that records racing through the placeholder configure once."""
+        root_logger = get_logger("root")
+        placeholder = _ConfigureOnFirstUse()
+        root_logger.addHandler(placeholder)
+        calls = []
+
+        def slow_configure():
+            calls.append(1)
+            time.sleep(0.05)
+            root_logger.addHandler(logging.NullHandler())
+
+        record = logging.LogRecord("skoglib", logging.WARNING, "", 0, "x", (), None)
+        with patch.dict(
+            _ConfigureOnFirstUse.handle.__globals__,
+            {"configure_from_env": slow_configure},
+        ):
+            threads = [
+                threading.Thread(target=placeholder.handle, args=(record,))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(root_logger.handlers), 1)
+
+    def test_configure_logging_replaces_placeholder(self):
+        """Test that explicit configuration is not blocked by the placeholder."""
+        placeholder = _ConfigureOnFirstUse()
+        root_logger = get_logger("root")
+        root_logger.addHandler(placeholder)
+
+        with patch.dict(configure_logging.__globals__, {"_lazy_handler": placeholder}):
+            configure_logging(level="INFO")
+
+        self.assertEqual(len(root_logger.handlers), 1)
+        self.assertIsInstance(root_logger.handlers[0], logging.StreamHandler)
+
     def test_configure_logging_defaults(self):
         """Test configure_logging with default parameters."""
         configure_logging()
@@ -370,14 +432,29 @@ class TestConfigureFromEnv(TestCase):
 class TestGetPerformanceLogger(TestCase):
     """Test the get_performance_logger function."""
 
+    def tearDown(self):
+        """Restore the default test logging level."""
+        configure_logging(level="WARNING", force=True)
+
     def test_get_performance_logger(self):
         """Test that get_performance_logger returns a PerformanceLogger."""
+        configure_logging(level=logging.DEBUG, force=True)
         perf_logger = get_performance_logger("test_operation")
 
         self.assertIsInstance(perf_logger, PerformanceLogger)
         self.assertEqual(perf_logger.operation, "test_operation")
         self.assertEqual(perf_logger.logger.name, f"{LOGGER_PREFIX}.performance")
 
+    def test_get_performance_logger_disabled_is_noop(self):
+        """Test that a shared no-op is returned when DEBUG is disabled."""
+        configure_logging(level=logging.WARNING, force=True)
+        perf_logger = get_performance_logger("test_operation")
+
+        self.assertIsInstance(perf_logger, PerformanceLogger)
+        self.assertIs(perf_logger, get_performance_logger("other_operation"))
+        with perf_logger as entered:
+            self.assertIs(entered, perf_logger)
+
 
 class TestLoggingIntegration(TestCase):
     """Test logging integration scenarios."""
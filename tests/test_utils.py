@@ -5,6 +5,7 @@ Comprehensive tests for performance timing utilities, path handling,
 and general utility functions.
 """
 
+import logging
 import time
 import pytest
 import tempfile
@@ -117,6 +118,11 @@ class TestFormatDuration:
         assert format_duration(0) == "0.00s"
         assert format_duration(0.0) == "0.00s"
 
+    def test_rounding_matches_printed_precision(self):
+        """Test that values on a rounding boundary print as before."""
+        assert format_duration(1.295) == f"{1.295:.2f}s"
+        assert format_duration(0.0012345) == f"{0.0012345 * 1000:.2f}ms"
+
 
 class TestTimingDecorator:
     """Test the timing_decorator function."""
@@ -154,6 +160,34 @@ class TestTimingDecorator:
         expected = {"args": (1, 2), "kwargs": {"key": "value", "other": True}}
         assert result == expected
 
+    def test_decorator_records_delivered_synchronously(self):
+        """Test that decorator records reach the skoglib handlers in order."""
+        received = []
+
+        class Collect(logging.Handler):
+            def emit(self, record):
+                received.append(record)
+
+        handler = Collect()
+        root_logger = logging.getLogger("skoglib")
+        old_level = root_logger.level
+        root_logger.addHandler(handler)
+        root_logger.setLevel(logging.DEBUG)
+        try:
+
+            @timing_decorator
+            def logged_function():
+                return "done"
+
+            assert logged_function() == "done"
+        finally:
+            root_logger.removeHandler(handler)
+            root_logger.setLevel(old_level)
+
+        assert received[0].name == "skoglib.utils"
+        assert "logged_function" in received[0].getMessage()
+        assert received[0].function == "logged_function"
+
     @patch("skoglib.utils.logger")
     def test_decorator_logging_success(self, mock_logger):
         """Test that decorator logs successful execution."""